@@ -0,0 +1,9 @@
+# /bin/bash
+# Usage: ./bench.sh [baseline.json]
+
+# write results to "bench.json", comparing them with a baseline if one is given
+if [ -n "$1" ]; then
+    python benchmarks/benchmarkSuite.py --output bench.json --baseline "$1"
+else
+    python benchmarks/benchmarkSuite.py --output bench.json
+fi
@@ -0,0 +1,287 @@
+# Microbenchmarks for the hot paths of pyenvlib and the game loop.
+# Usage: python benchmarks/benchmarkSuite.py [--output results.json] [--baseline old.json]
+#
+# Each benchmark reports the best time per operation over several repeats.
+# With --baseline, results are compared against a previous run and the
+# script exits with status 1 if any benchmark got slower than the threshold.
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.config import Config
+from engine.gameEngine import GameEngine
+from lib.pyenvlib import compactMode
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+from lib.pyenvlib.grid import Grid
+from snake.snakePart import SnakePart
+from textui.textrenderer import TextRenderer
+
+GRID_SIZES = [5, 12, 50, 200, 1000]
+SNAKE_LENGTHS = [1, 10, 100, 1000]
+FILL_RATIOS = [0.5, 0.9, 0.99]
+
+
+# Returns the best time per call of a function, running it in batches for at least minimumTime seconds per repeat.
+def measure(function, minimumTime, repeats=3):
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= minimumTime:
+            break
+        calls *= 2 if elapsed == 0 else max(2, int(minimumTime / elapsed) + 1)
+
+    best = elapsed / calls
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+# Returns an engine on a size x size board whose ophidian runs along the top row.
+def createEngine(size, length, wrap=True):
+    config = Config()
+    config.gridSize = size
+    config.wrapAroundEdges = wrap
+    engine = GameEngine(config, seed=0)
+    grid = engine.getEnvironment().getGrid()
+
+    # start again with the head in the top right corner, facing away from its body
+    grid.clear()
+    head = engine.getSelectedSnakePart()
+    engine.environment.addEntityToLocation(
+        head, grid.getLocationByCoordinates(size - 1, 0)
+    )
+    head.setDirection(Direction.RIGHT)
+    engine.snakeBody.parts.clear()
+    engine.snakeBody.parts.append(head)
+    head.setPrevious(-1)
+    for x in range(size - 2, size - 1 - length, -1):
+        engine.spawnSnakePart(
+            grid.getLocationByCoordinates(x % size, 0), engine.generateColor()
+        )
+    return engine
+
+
+# Covers the given fraction of the grid with snake parts that are not attached to the ophidian.
+def fillGrid(engine, ratio):
+    grid = engine.getEnvironment().getGrid()
+    target = int(grid.getSize() * ratio)
+    while grid.getNumEntities() < target:
+        location = grid.getRandomEmptyLocation(engine.getRandom())
+        engine.getEnvironment().addEntityToLocation(SnakePart((0, 0, 0)), location)
+
+
+def benchmarkGridConstruction(results, minimumTime):
+    for size in GRID_SIZES:
+        results["gridConstruction/%d" % size] = measure(
+            lambda: Grid(size, size), minimumTime, repeats=1 if size >= 1000 else 3
+        )
+
+
+def benchmarkLookups(results, minimumTime):
+    for size in GRID_SIZES:
+        grid = Grid(size, size)
+        coordinates = [
+            (random.randrange(size), random.randrange(size)) for _ in range(1000)
+        ]
+        locations = [grid.getLocationByCoordinates(x, y) for x, y in coordinates]
+
+        def lookUpCoordinates():
+            for x, y in coordinates:
+                grid.getLocationByCoordinates(x, y)
+
+        def lookUpNeighbours():
+            for location in locations:
+                grid.getNeighbour(location, Direction.UP)
+                grid.getNeighbour(location, Direction.RIGHT)
+
+        results["getLocationByCoordinates/%d" % size] = (
+            measure(lookUpCoordinates, minimumTime) / 1000
+        )
+        results["getNeighbour/%d" % size] = (
+            measure(lookUpNeighbours, minimumTime) / 2000
+        )
+
+
+def benchmarkMoveEntity(results, minimumTime):
+    size = 1000
+    for length in SNAKE_LENGTHS:
+        length = min(length, size - 1)
+        engine = createEngine(size, length)
+        head = engine.getSelectedSnakePart()
+
+        def move():
+            engine.moveEntity(head, Direction.RIGHT)
+            engine.stepResult.changedLocations.clear()
+
+        results["moveEntity/length%d" % length] = measure(move, minimumTime)
+        assert not engine.hasCollided()
+
+
+def benchmarkSpawnFood(results, minimumTime):
+    for size in [12, 200]:
+        for ratio in FILL_RATIOS:
+            engine = createEngine(size, 1)
+            fillGrid(engine, ratio)
+            grid = engine.getEnvironment().getGrid()
+
+            def spawnAndRemoveFood():
+                engine.spawnFood()
+                for location in engine.stepResult.changedLocations:
+                    if grid.getCellState(location) == CellState.FOOD:
+                        for entity in list(location.getEntities().values()):
+                            location.removeEntity(entity)
+                engine.stepResult.changedLocations.clear()
+
+            results["spawnFood/%d/%d%%" % (size, ratio * 100)] = measure(
+                spawnAndRemoveFood, minimumTime
+            )
+
+
+def benchmarkTextRenderer(results, minimumTime):
+    for size in [5, 12, 50, 200]:
+        engine = createEngine(size, min(size - 1, 100))
+        renderer = TextRenderer(engine.config, io.StringIO())
+        environment = engine.getEnvironment()
+        snakeBody = engine.getSnakeBody()
+        head = engine.getSelectedSnakePart()
+
+        def renderFullFrame():
+            renderer.invalidate()
+            renderer.renderGrid(environment, snakeBody, False)
+            renderer.flush()
+            renderer.output.seek(0)
+            renderer.output.truncate()
+
+        def renderChangedFrame():
+            engine.moveEntity(head, Direction.RIGHT)
+            engine.stepResult.changedLocations.clear()
+            renderer.renderGrid(environment, snakeBody, False)
+            renderer.flush()
+            renderer.output.seek(0)
+            renderer.output.truncate()
+
+        results["renderGrid/full/%d" % size] = measure(renderFullFrame, minimumTime)
+        results["renderGrid/changed/%d" % size] = measure(
+            renderChangedFrame, minimumTime
+        )
+
+
+def benchmarkDrawEnvironment(results, minimumTime):
+    try:
+        import pygame  # noqa: F401
+    except ImportError:
+        print("pygame is not installed, skipping drawEnvironment benchmarks")
+        return
+
+    from ophidian import Ophidian
+
+    for size in [12, 50, 200]:
+        ophidian = Ophidian()
+        ophidian.engine.config.gridSize = size
+        ophidian.engine.initialize()
+        ophidian.startLevel()
+        results["drawEnvironment/%d" % size] = measure(
+            ophidian.drawEnvironment, minimumTime
+        )
+
+
+BENCHMARKS = {
+    "grid": benchmarkGridConstruction,
+    "lookups": benchmarkLookups,
+    "moveEntity": benchmarkMoveEntity,
+    "spawnFood": benchmarkSpawnFood,
+    "textRenderer": benchmarkTextRenderer,
+    "drawEnvironment": benchmarkDrawEnvironment,
+}
+
+
+# Prints each result next to its baseline and returns the names that regressed.
+def compareWithBaseline(results, baseline, threshold):
+    regressions = []
+    print("%-36s %14s %14s %8s" % ("benchmark", "baseline", "current", "ratio"))
+    for name, seconds in results.items():
+        if name not in baseline:
+            print("%-36s %14s %14.3e %8s" % (name, "-", seconds, "new"))
+            continue
+        ratio = seconds / baseline[name]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(
+            "%-36s %14.3e %14.3e %7.2fx%s"
+            % (name, baseline[name], seconds, ratio, flag)
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ophidian microbenchmarks")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument(
+        "--baseline", help="compare against results from a previous run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio that counts as a regression (default 1.25)",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=sorted(BENCHMARKS),
+        help="run only these groups of benchmarks",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="minimum seconds per measurement (default 0.1)",
+    )
+    args = parser.parse_args()
+
+    random.seed(0)
+    compactMode.setCompactMode(Config().compactEntities)
+    results = {}
+    for group in args.only or BENCHMARKS:
+        BENCHMARKS[group](results, args.min_time)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "secondsPerOperation": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["secondsPerOperation"]
+        regressions = compareWithBaseline(results, baseline, args.threshold)
+        if regressions:
+            print("%d benchmark(s) regressed" % len(regressions))
+            sys.exit(1)
+    else:
+        for name, seconds in results.items():
+            print("%-36s %14.3e s" % (name, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Compares full-board redraws by the cell renderer and the surface renderer.
+# Runs under the SDL dummy video driver, so no window is opened.
+# Usage: python benchmarks/boardRenderers.py [size ...]
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ophidian import Ophidian
+from snake.snakePart import SnakePart
+
+
+# Builds a front end with a board of the given size, half of which is covered by the ophidian.
+def createOphidian(size, boardRenderer):
+    ophidian = Ophidian(boardRenderer=boardRenderer)
+    engine = ophidian.engine
+    engine.config.gridSize = size
+    engine.initialize()
+    ophidian.startLevel()
+
+    environment = engine.getEnvironment()
+    grid = environment.getGrid()
+    for index in range(0, grid.getSize(), 2):
+        location = grid.getLocationByCoordinates(index % size, index // size)
+        if location.getNumEntities() == 0:
+            environment.addEntityToLocation(SnakePart(engine.generateColor()), location)
+    return ophidian
+
+
+def measureRedraw(ophidian, repetitions):
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        ophidian.drawEnvironment()
+    return (time.perf_counter() - start) / repetitions
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [12, 50, 100, 200, 500, 1000]
+    print("| Grid size | Cell renderer (ms) | Surface renderer (ms) |")
+    print("| --------- | ------------------ | --------------------- |")
+    for size in sizes:
+        repetitions = max(1, 20000 // (size * size))
+        timings = []
+        for boardRenderer in ("cells", "surface"):
+            ophidian = createOphidian(size, boardRenderer)
+            if boardRenderer == "surface" and ophidian.surfaceRenderer is None:
+                timings.append(float("nan"))
+                continue
+            timings.append(measureRedraw(ophidian, repetitions) * 1000)
+        print("| %dx%d | %.2f | %.2f |" % (size, size, timings[0], timings[1]))
+
+
+if __name__ == "__main__":
+    main()
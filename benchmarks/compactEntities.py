@@ -0,0 +1,56 @@
+# Compares the cost of building grids in standard and compact mode.
+# Usage: python benchmarks/compactEntities.py [size ...]
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from lib.pyenvlib import compactMode
+from lib.pyenvlib.grid import Grid
+
+
+def measureConstructionTime(size):
+    gc.collect()
+    start = time.perf_counter()
+    grid = Grid(size, size)
+    elapsed = time.perf_counter() - start
+    del grid
+    return elapsed
+
+
+def measureMemory(size):
+    gc.collect()
+    tracemalloc.start()
+    grid = Grid(size, size)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del grid
+    return current
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 500, 1000]
+    print("| Grid size | Mode | Construction (s) | Memory (MiB) |")
+    print("| --------- | ---- | ---------------- | ------------ |")
+    for size in sizes:
+        for enabled in (False, True):
+            compactMode.setCompactMode(enabled)
+            elapsed = measureConstructionTime(size)
+            memory = measureMemory(size)
+            print(
+                "| %dx%d | %s | %.3f | %.1f |"
+                % (
+                    size,
+                    size,
+                    "compact" if enabled else "standard",
+                    elapsed,
+                    memory / (1024 * 1024),
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from agents.bfsAgent import BfsAgent
+from agents.hamiltonianAgent import HamiltonianAgent
+from agents.monteCarloAgent import MonteCarloAgent
+from agents.randomAgent import RandomAgent
+
+# Agents by the name used for them on the command line. Each one is created
+# with a seed and returns a direction (or None) from chooseDirection(engine).
+AGENTS = {
+    "bfs": BfsAgent,
+    "hamiltonian": HamiltonianAgent,
+    "montecarlo": MonteCarloAgent,
+    "random": RandomAgent,
+}
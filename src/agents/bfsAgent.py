@@ -0,0 +1,137 @@
+from array import array
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Heads for the food along a shortest path that avoids the body. The search
+# runs on the grid's cell states and neighbour table, with scratch buffers
+# that are allocated once per grid size. Visited cells are marked with a
+# stamp instead of clearing a buffer before each search. The path is planned
+# once per food and followed until the food or the head is not where the plan
+# expects. The body only ever moves into cells the head has left, so a planned
+# path stays clear. When no path exists, the agent moves towards the most room.
+class BfsAgent:
+    def __init__(self, seed=None):
+        self.cells = 0
+        self.stamps = array("i")
+        self.stamp = 0
+        self.parents = array("i")
+        self.parentDirections = bytearray()
+        self.queue = array("i")
+        self.path = []
+        self.plannedHead = -1
+        self.plannedFood = -1
+
+    # Called when a game starts again from a new seed.
+    def reset(self, seed=None):
+        self.path = []
+        self.plannedHead = -1
+
+    # Makes sure the scratch buffers fit a grid with the given number of cells.
+    def prepare(self, cells):
+        if self.cells == cells:
+            return
+        self.cells = cells
+        self.stamps = array("i", bytes(4 * cells))
+        self.stamp = 0
+        self.parents = array("i", bytes(4 * cells))
+        self.parentDirections = bytearray(cells)
+        self.queue = array("i", bytes(4 * cells))
+        self.path = []
+
+    def chooseDirection(self, engine):
+        grid = engine.getEnvironment().getGrid()
+        cellStates = grid.getCellStates()
+        neighbours = grid.getNeighbourTable()
+        self.prepare(len(cellStates))
+
+        head = grid.getLocation(engine.getSelectedSnakePart().getLocationID())
+        headIndex = head.getY() * grid.getColumns() + head.getX()
+        food = cellStates.find(CellState.FOOD)
+
+        # follow the current plan while it still holds
+        if self.path and headIndex == self.plannedHead and food == self.plannedFood:
+            direction = self.path.pop()
+            nextIndex = neighbours[headIndex * 4 + direction]
+            if cellStates[nextIndex] != CellState.SNAKE:
+                self.plannedHead = nextIndex
+                return Direction(direction)
+
+        current = engine.getSelectedSnakePart().getDirection()
+        self.path = []
+        if food != -1 and self.search(cellStates, neighbours, headIndex, current, food):
+            self.plannedFood = food
+            direction = self.path.pop()
+            self.plannedHead = neighbours[headIndex * 4 + direction]
+            return Direction(direction)
+        return self.chooseEscape(
+            cellStates, neighbours, headIndex, current, len(engine.getSnakeBody())
+        )
+
+    # Searches outwards from the head without reversing. Fills self.path with
+    # directions from the target back to the head and returns whether the
+    # target was reached. With target -1, returns the number of cells reached,
+    # stopping once limit cells have been found.
+    def search(self, cellStates, neighbours, start, current, target, limit=-1):
+        self.stamp += 1
+        stamp = self.stamp
+        stamps = self.stamps
+        parents = self.parents
+        parentDirections = self.parentDirections
+        queue = self.queue
+        snake = CellState.SNAKE
+        reverse = current.getOpposite() if current is not None else -1
+
+        stamps[start] = stamp
+        queue[0] = start
+        first = 0
+        last = 1
+        while first < last:
+            cell = queue[first]
+            first += 1
+            base = cell * 4
+            for direction in range(4):
+                neighbour = neighbours[base + direction]
+                if (
+                    neighbour == -1
+                    or stamps[neighbour] == stamp
+                    or cellStates[neighbour] == snake
+                ):
+                    continue
+                if cell == start and direction == reverse:
+                    continue
+                stamps[neighbour] = stamp
+                parents[neighbour] = cell
+                parentDirections[neighbour] = direction
+                if neighbour == target:
+                    while neighbour != start:
+                        self.path.append(parentDirections[neighbour])
+                        neighbour = parents[neighbour]
+                    return True
+                queue[last] = neighbour
+                last += 1
+                if last == limit:
+                    return last
+        if target == -1:
+            return last
+        return False
+
+    # Returns the safe direction leading to the largest open area, or None if every move collides.
+    def chooseEscape(self, cellStates, neighbours, headIndex, current, length):
+        best = None
+        bestRoom = -1
+        for direction in Direction:
+            if direction == current.getOpposite():
+                continue
+            neighbour = neighbours[headIndex * 4 + direction]
+            if neighbour == -1 or cellStates[neighbour] == CellState.SNAKE:
+                continue
+            room = self.search(cellStates, neighbours, neighbour, None, -1, length + 1)
+            if room > bestRoom:
+                best = direction
+                bestRoom = room
+        self.path = []
+        return best
@@ -0,0 +1,117 @@
+from collections import deque
+from lib.pyenvlib.cellState import CellState
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# A stripped down copy of a game for agents to play ahead on. It keeps only
+# the cell states, the neighbour table and the body as location indices from
+# head to tail, so copying it costs one bytearray and one deque. It follows
+# the engine's rules: hitting a wall without wrapping leaves the ophidian
+# where it is, and entering a cell of its body is a collision. Food is placed
+# with the copy's own random number generator, so where new food appears
+# differs from the real game.
+class CompactGame:
+    COLLIDED = -1
+    MOVED = 0
+    ATE = 1
+
+    def __init__(self, columns, neighbours, cellStates, body, direction, food, random):
+        self.columns = columns
+        self.neighbours = neighbours
+        self.cellStates = cellStates
+        self.body = body
+        self.direction = direction
+        self.food = food
+        self.random = random
+
+    # Returns a compact copy of the engine's current game.
+    @staticmethod
+    def fromEngine(engine, random):
+        grid = engine.getEnvironment().getGrid()
+        columns = grid.getColumns()
+        body = deque()
+        for part in engine.getSnakeBody():
+            location = grid.getLocation(part.getLocationID())
+            body.append(location.getY() * columns + location.getX())
+        cellStates = bytearray(grid.getCellStates())
+        return CompactGame(
+            columns,
+            grid.getNeighbourTable(),
+            cellStates,
+            body,
+            engine.getSelectedSnakePart().getDirection(),
+            cellStates.find(CellState.FOOD),
+            random,
+        )
+
+    # Returns a copy that can be played on without changing this one. The neighbour table is shared.
+    def copy(self):
+        return CompactGame(
+            self.columns,
+            self.neighbours,
+            self.cellStates[:],
+            self.body.copy(),
+            self.direction,
+            self.food,
+            self.random,
+        )
+
+    def getColumns(self):
+        return self.columns
+
+    def getHead(self):
+        return self.body[0]
+
+    # Returns the index of the food, or -1 if there is none.
+    def getFood(self):
+        return self.food
+
+    def getDirection(self):
+        return self.direction
+
+    def getCellStates(self):
+        return self.cellStates
+
+    def getNeighbours(self):
+        return self.neighbours
+
+    # Moves the head one cell. Returns COLLIDED, MOVED or ATE.
+    def step(self, direction):
+        if direction != self.direction and direction != (self.direction + 2) % 4:
+            self.direction = direction
+        cellStates = self.cellStates
+        target = self.neighbours[self.body[0] * 4 + self.direction]
+        if target == -1:
+            return self.MOVED
+        state = cellStates[target]
+        if state == CellState.SNAKE:
+            return self.COLLIDED
+        cellStates[target] = CellState.SNAKE
+        self.body.appendleft(target)
+        if state == CellState.FOOD:
+            # the new part takes the place of the tail, so the tail stays
+            self.spawnFood()
+            return self.ATE
+        cellStates[self.body.pop()] = CellState.EMPTY
+        return self.MOVED
+
+    # Places food on a random empty cell, if there is one.
+    def spawnFood(self):
+        cellStates = self.cellStates
+        count = len(cellStates)
+        for _ in range(8):
+            index = self.random.randrange(count)
+            if cellStates[index] == CellState.EMPTY:
+                cellStates[index] = CellState.FOOD
+                self.food = index
+                return
+        # the board is nearly full, so look for an empty cell from a random starting point
+        start = self.random.randrange(count)
+        index = cellStates.find(CellState.EMPTY, start)
+        if index == -1:
+            index = cellStates.find(CellState.EMPTY)
+        if index != -1:
+            cellStates[index] = CellState.FOOD
+        self.food = index
@@ -0,0 +1,130 @@
+from array import array
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Follows a fixed cycle through every cell of the grid. This is slow, but it
+# never traps itself and it fills the whole board. The cycle goes along the
+# top row, snakes back through the remaining columns, and returns up the first
+# column. This needs an even number of rows, or of columns with the cycle
+# turned on its side.
+#
+# A grid with an odd number of both has no such cycle, so the cycle skips the
+# bottom right corner instead. It runs p -> x -> q through the cells around
+# that corner, and p -> corner -> q is an equally long detour. At p the agent
+# takes whichever of the two holds the food and otherwise repeats its last
+# choice, so the corner is never left out. The cell it does not enter has
+# been empty for a full lap. On these grids the ophidian reaches every cell
+# but one. The head may not enter the cell the tail is leaving, so the last
+# cell could only be reached through a cycle over the whole board.
+class HamiltonianAgent:
+    def __init__(self, seed=None):
+        self.shape = None
+        self.successors = array("i")
+        self.detour = -1
+        self.middles = (-1, -1)
+        self.middle = -1
+
+    # Called when a game starts again from a new seed.
+    def reset(self, seed=None):
+        self.shape = None
+
+    # Builds the cycle for a grid, storing the index of each cell's successor.
+    def buildCycle(self, columns, rows):
+        self.shape = (columns, rows)
+        self.successors = array("i", [-1]) * (columns * rows)
+        self.detour = -1
+        if rows % 2 == 0:
+            order = self.getCycle(columns, rows, False)
+        elif columns % 2 == 0:
+            order = self.getCycle(rows, columns, True)
+        else:
+            order = self.getOddCycle(columns, rows)
+        for position in range(len(order)):
+            x, y = order[position]
+            nextX, nextY = order[(position + 1) % len(order)]
+            self.successors[y * columns + x] = nextY * columns + nextX
+
+        if rows % 2 == 1 and columns % 2 == 1 and columns > 1 and rows > 1:
+            # p -> x -> q, with the corner as the alternative to x
+            p = (rows - 2) * columns + columns - 1
+            x = (rows - 2) * columns + columns - 2
+            corner = rows * columns - 1
+            self.detour = p
+            self.middles = (x, corner)
+            self.middle = x
+            self.successors[corner] = self.successors[x]
+
+    # Returns the cells of a cycle through a grid with an even number of rows.
+    # The coordinates are swapped when transpose is set.
+    def getCycle(self, columns, rows, transpose):
+        order = []
+        for y in range(rows):
+            xs = range(1, columns) if y % 2 == 0 else range(columns - 1, 0, -1)
+            order.extend((x, y) for x in xs)
+        order.extend((0, y) for y in range(rows - 1, -1, -1))
+        if transpose:
+            return [(y, x) for x, y in order]
+        return order
+
+    # Returns the cells of a cycle through an odd by odd grid, without the bottom right corner.
+    # The last two rows are covered column by column in a zigzag.
+    def getOddCycle(self, columns, rows):
+        order = []
+        for y in range(rows - 2):
+            xs = range(1, columns) if y % 2 == 0 else range(columns - 1, 0, -1)
+            order.extend((x, y) for x in xs)
+        order.append((columns - 1, rows - 2))
+        for x in range(columns - 2, 0, -1):
+            if (columns - 2 - x) % 2 == 0:
+                order.extend(((x, rows - 2), (x, rows - 1)))
+            else:
+                order.extend(((x, rows - 1), (x, rows - 2)))
+        order.extend((0, y) for y in range(rows - 1, -1, -1))
+        return order
+
+    def chooseDirection(self, engine):
+        grid = engine.getEnvironment().getGrid()
+        columns = grid.getColumns()
+        if self.shape != (columns, grid.getRows()):
+            self.buildCycle(columns, grid.getRows())
+
+        head = grid.getLocation(engine.getSelectedSnakePart().getLocationID())
+        headIndex = head.getY() * columns + head.getX()
+        if headIndex == self.detour:
+            food = grid.getCellStates().find(CellState.FOOD)
+            if food in self.middles:
+                self.middle = food
+            nextIndex = self.middle
+        else:
+            nextIndex = self.successors[headIndex]
+
+        direction = self.getDirectionBetween(
+            headIndex, nextIndex, columns, grid.getRows()
+        )
+        if engine.isValidDirectionChange(direction):
+            return direction
+
+        # only a lone head can face away from the cycle, so step sideways to turn around
+        for sideways in (
+            Direction((direction + 1) % 4),
+            Direction((direction + 3) % 4),
+        ):
+            if grid.getNeighbour(head, sideways) != -1:
+                return sideways
+        return None
+
+    # Returns the direction from one cell to a neighbouring cell.
+    def getDirectionBetween(self, index, nextIndex, columns, rows):
+        y, x = divmod(index, columns)
+        nextY, nextX = divmod(nextIndex, columns)
+        if nextX == x:
+            if nextY == y + 1 or (nextY == 0 and y == rows - 1):
+                return Direction.DOWN
+            return Direction.UP
+        if nextX == x + 1 or (nextX == 0 and x == columns - 1):
+            return Direction.RIGHT
+        return Direction.LEFT
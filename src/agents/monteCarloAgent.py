@@ -0,0 +1,213 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from agents.compactGame import CompactGame
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+
+DISCOUNT = 0.95
+COLLISION_PENALTY = 2.0
+GREEDY_CHANCE = 0.5
+
+# the neighbour table of the board being searched, set once in each worker process
+workerNeighbours = None
+
+
+# Plays a game copy forward from a first move and returns its value: food
+# eaten, discounted by how long it took, minus a penalty for colliding.
+def rollout(game, firstDirection, depth):
+    rng = game.random
+    neighbours = game.neighbours
+    cellStates = game.cellStates
+    columns = game.columns
+    snake = CellState.SNAKE
+    value = 0.0
+    weight = 1.0
+    result = game.step(firstDirection)
+    for _ in range(depth):
+        if result == CompactGame.COLLIDED:
+            return value - COLLISION_PENALTY * weight
+        if result == CompactGame.ATE:
+            value += weight
+        weight *= DISCOUNT
+
+        head = game.body[0]
+        reverse = (game.direction + 2) % 4
+        choice = -1
+        if game.food != -1 and rng.random() < GREEDY_CHANCE:
+            # step towards the food if that is safe
+            headY, headX = divmod(head, columns)
+            foodY, foodX = divmod(game.food, columns)
+            if foodX != headX:
+                choice = Direction.RIGHT if foodX > headX else Direction.LEFT
+            else:
+                choice = Direction.DOWN if foodY > headY else Direction.UP
+            target = neighbours[head * 4 + choice]
+            if choice == reverse or target == -1 or cellStates[target] == snake:
+                choice = -1
+        if choice == -1:
+            options = [
+                direction
+                for direction in range(4)
+                if direction != reverse
+                and neighbours[head * 4 + direction] != -1
+                and cellStates[neighbours[head * 4 + direction]] != snake
+            ]
+            choice = rng.choice(options) if options else game.direction
+        result = game.step(choice)
+    return value
+
+
+# Runs rollouts for each first move in turn until the budget in seconds is
+# used up, at least once each. Returns the total value and count per move.
+def runRollouts(game, directions, budget, depth):
+    totals = [0.0] * len(directions)
+    counts = [0] * len(directions)
+    deadline = time.perf_counter() + budget
+    position = 0
+    while True:
+        totals[position] += rollout(game.copy(), directions[position], depth)
+        counts[position] += 1
+        position = (position + 1) % len(directions)
+        if counts[-1] > 0 and time.perf_counter() >= deadline:
+            return totals, counts
+
+
+# Called in each new worker process with the neighbour table, so that it is
+# sent once per board instead of with every tick's game.
+def initializeWorker(neighbours):
+    global workerNeighbours
+    workerNeighbours = neighbours
+
+
+# Runs rollouts in a worker process with its own random number generator.
+def runRolloutsInWorker(game, directions, budget, depth, seed):
+    game.neighbours = workerNeighbours
+    game.random = random.Random(seed)
+    return runRollouts(game, directions, budget, depth)
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Each tick, plays many short games ahead from every move that does not
+# collide at once, on compact copies of the game, and takes the move whose
+# games went best on average. The rollouts step towards the food half the
+# time and move at random otherwise. Thinking time is config.autopilotBudget
+# of each tick, so the agent keeps up in real time at any board size.
+# With config.autopilotWorkers set, the rollouts are shared out over that
+# many worker processes. The pool is started again whenever the board's
+# neighbour table changes, and the time spent sending work to the workers and
+# collecting their results is taken off the time they may think for.
+class MonteCarloAgent:
+    OVERHEAD_SMOOTHING = 0.25
+
+    def __init__(self, seed=None, depth=-1):
+        self.random = random.Random(seed)
+        self.depth = depth
+        self.executor = None
+        self.workers = 0
+        self.neighbours = None
+        self.dispatchOverhead = None
+
+    # Called when a game starts again from a new seed.
+    def reset(self, seed=None):
+        self.random.seed(seed)
+
+    def chooseDirection(self, engine):
+        config = engine.config
+        grid = engine.getEnvironment().getGrid()
+        head = grid.getLocation(engine.getSelectedSnakePart().getLocationID())
+        directions = [
+            direction
+            for direction in Direction
+            if engine.isValidDirectionChange(direction)
+            and grid.getNeighbour(head, direction) != -1
+            and grid.getCellState(grid.getNeighbour(head, direction)) != CellState.SNAKE
+        ]
+        if len(directions) < 2:
+            return directions[0] if directions else None
+
+        game = CompactGame.fromEngine(engine, self.random)
+        depth = self.depth
+        if depth == -1:
+            depth = grid.getColumns() + grid.getRows()
+        budget = config.tickSpeed * config.autopilotBudget
+
+        if config.autopilotWorkers > 0:
+            totals, counts = self.runInWorkers(
+                config.autopilotWorkers, game, directions, budget, depth
+            )
+        else:
+            totals, counts = runRollouts(game, directions, budget, depth)
+
+        best = 0
+        for position in range(1, len(directions)):
+            if totals[position] / counts[position] > totals[best] / counts[best]:
+                best = position
+        return directions[best]
+
+    # Shares the rollouts out over worker processes and adds up their results.
+    def runInWorkers(self, workers, game, directions, budget, depth):
+        if (
+            self.executor is None
+            or self.workers != workers
+            or self.neighbours is not game.neighbours
+        ):
+            self.close()
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=initializeWorker,
+                initargs=(game.neighbours,),
+            )
+            self.workers = workers
+            self.neighbours = game.neighbours
+            self.dispatchOverhead = None
+
+        start = time.perf_counter()
+        workerBudget = max(0.0, budget - (self.dispatchOverhead or 0.0))
+        # the workers already hold the neighbour table, so leave it out of the game that is sent
+        game = CompactGame(
+            game.columns,
+            None,
+            game.cellStates,
+            game.body,
+            game.direction,
+            game.food,
+            None,
+        )
+        futures = [
+            self.executor.submit(
+                runRolloutsInWorker,
+                game,
+                directions,
+                workerBudget,
+                depth,
+                self.random.getrandbits(32),
+            )
+            for _ in range(workers)
+        ]
+        totals = [0.0] * len(directions)
+        counts = [0] * len(directions)
+        for future in futures:
+            workerTotals, workerCounts = future.result()
+            for position in range(len(directions)):
+                totals[position] += workerTotals[position]
+                counts[position] += workerCounts[position]
+
+        overhead = time.perf_counter() - start - workerBudget
+        if self.dispatchOverhead is None:
+            # the first tick also waited for the workers to start, so it is not counted
+            self.dispatchOverhead = 0.0
+        else:
+            self.dispatchOverhead += (
+                overhead - self.dispatchOverhead
+            ) * self.OVERHEAD_SMOOTHING
+        return totals, counts
+
+    # Shuts down the worker processes, if any were started.
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+            self.neighbours = None
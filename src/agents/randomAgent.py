@@ -0,0 +1,39 @@
+import random
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Wanders at random, but never turns into a wall or its own body when it can help it.
+# Agents return the direction to pass to GameEngine.step, or None to keep going straight.
+class RandomAgent:
+    def __init__(self, seed=None, turnChance=0.25):
+        self.random = random.Random(seed)
+        self.turnChance = turnChance
+
+    # Called when a game starts again from a new seed.
+    def reset(self, seed=None):
+        self.random.seed(seed)
+
+    # Returns whether moving in a direction avoids walls and the body for this tick.
+    def isSafe(self, engine, direction):
+        grid = engine.getEnvironment().getGrid()
+        location = grid.getLocation(engine.getSelectedSnakePart().getLocationID())
+        neighbour = grid.getNeighbour(location, direction)
+        return neighbour != -1 and grid.getCellState(neighbour) != CellState.SNAKE
+
+    def chooseDirection(self, engine):
+        current = engine.getSelectedSnakePart().getDirection()
+        if self.random.random() >= self.turnChance and self.isSafe(engine, current):
+            return None
+        options = [
+            direction
+            for direction in Direction
+            if engine.isValidDirectionChange(direction)
+            and self.isSafe(engine, direction)
+        ]
+        if not options:
+            return None
+        return self.random.choice(options)
@@ -0,0 +1,144 @@
+import json
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from agents.agentRegistry import AGENTS
+from config.config import Config
+from engine.gameEngine import GameEngine
+from lib.pyenvlib import compactMode
+
+# Optional dependency, only needed to write .npz results
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+COLUMNS = ("seed", "length", "score", "level", "ticks", "cause")
+
+
+# Plays one game from the first level until the ophidian dies or maxTicks
+# ticks have passed. Like the interactive game, a collision moves on to the
+# next level when enough progress was made and ends the game otherwise.
+# Returns (length, score, level, ticks, cause of death).
+def playGame(engine, agent, maxTicks):
+    ticks = 0
+    while ticks < maxTicks:
+        result = engine.step(agent.chooseDirection(engine))
+        ticks += 1
+        if result.hasCollided():
+            if engine.hasReachedLevelProgressRequired():
+                engine.checkForLevelProgressAndReinitialize()
+                continue
+            return (
+                len(engine.getSnakeBody()),
+                engine.getScore(),
+                engine.getLevel(),
+                ticks,
+                "collision",
+            )
+    return (
+        len(engine.getSnakeBody()),
+        engine.getScore(),
+        engine.getLevel(),
+        ticks,
+        "tickLimit",
+    )
+
+
+# Plays one game per seed in a worker process and returns the results as columns.
+def playChunk(settings, agentName, seeds, maxTicks):
+    config = Config()
+    for name, value in settings.items():
+        setattr(config, name, value)
+    compactMode.setCompactMode(config.compactEntities)
+
+    engine = GameEngine(config, seeds[0])
+    agent = AGENTS[agentName](seeds[0])
+    columns = {name: array("q") for name in COLUMNS[:-1]}
+    causes = []
+    for seed in seeds:
+        engine.setSeed(seed)
+        engine.setLevel(1)
+        engine.initialize()
+        agent.reset(seed)
+        length, score, level, ticks, cause = playGame(engine, agent, maxTicks)
+        columns["seed"].append(seed)
+        columns["length"].append(length)
+        columns["score"].append(score)
+        columns["level"].append(level)
+        columns["ticks"].append(ticks)
+        causes.append(cause)
+    columns["cause"] = causes
+    return columns
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Plays many seeded headless games across a pool of worker processes. Each
+# worker plays a chunk of games and sends the results back as columns, which
+# are appended to the totals as chunks finish.
+class BatchRunner:
+    def __init__(
+        self,
+        settings=None,
+        agentName="random",
+        maxTicks=10000,
+        workers=None,
+        chunkSize=250,
+    ):
+        if agentName not in AGENTS:
+            raise ValueError("unknown agent " + agentName)
+        self.settings = settings if settings is not None else {}
+        self.agentName = agentName
+        self.maxTicks = maxTicks
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.chunkSize = chunkSize
+        self.results = {name: array("q") for name in COLUMNS[:-1]}
+        self.results["cause"] = []
+
+    # Returns the results collected so far, one list or array per column.
+    def getResults(self):
+        return self.results
+
+    # Plays numGames games seeded firstSeed, firstSeed + 1 and so on. Yields the
+    # number of finished games after each chunk arrives.
+    def run(self, numGames, firstSeed=0):
+        seeds = range(firstSeed, firstSeed + numGames)
+        finished = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(
+                    playChunk,
+                    self.settings,
+                    self.agentName,
+                    seeds[start : start + self.chunkSize],
+                    self.maxTicks,
+                )
+                for start in range(0, numGames, self.chunkSize)
+            ]
+            for future in as_completed(futures):
+                chunk = future.result()
+                for name in COLUMNS:
+                    self.results[name].extend(chunk[name])
+                finished += len(chunk["seed"])
+                yield finished
+
+    # Writes the results as columns, to .npz if the path ends with it (requires NumPy) and JSON otherwise.
+    def writeResults(self, path):
+        if path.endswith(".npz"):
+            if numpy is None:
+                raise ImportError("writing .npz results requires NumPy")
+            columns = {name: numpy.asarray(self.results[name]) for name in COLUMNS}
+            numpy.savez_compressed(path, **columns)
+            return
+        columns = {name: list(self.results[name]) for name in COLUMNS}
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "settings": self.settings,
+                    "agent": self.agentName,
+                    "columns": columns,
+                },
+                file,
+            )
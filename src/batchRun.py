@@ -0,0 +1,102 @@
+# Plays many headless games across all cores and writes the results as columns.
+# Usage: python src/batchRun.py --games 10000 --output results.npz
+import argparse
+import time
+from agents.agentRegistry import AGENTS
+from batch.batchRunner import BatchRunner
+
+
+# @author agent
+# @since October 17th, 2026
+def main():
+    parser = argparse.ArgumentParser(description="Play many headless Ophidian games")
+    parser.add_argument(
+        "--games", type=int, default=1000, help="Number of games to play"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the first game, the rest count up from it",
+    )
+    parser.add_argument(
+        "--agent", choices=sorted(AGENTS), default="random", help="Who plays the games"
+    )
+    parser.add_argument(
+        "--max-ticks",
+        type=int,
+        default=10000,
+        help="Ticks after which a game is stopped",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (all cores by default)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=250, help="Games per chunk sent to a worker"
+    )
+    parser.add_argument("--grid-size", type=int, help="Grid size of the first level")
+    parser.add_argument(
+        "--level-growth",
+        type=int,
+        help="How much wider and taller the grid gets each level",
+    )
+    parser.add_argument(
+        "--max-grid-size", type=int, help="Grid size at which levels stop growing"
+    )
+    parser.add_argument(
+        "--level-progress",
+        type=float,
+        help="Fraction of the grid to fill before a collision moves on to the next level",
+    )
+    parser.add_argument(
+        "--wrap", action="store_true", help="Wrap around the edges of the grid"
+    )
+    parser.add_argument(
+        "--output",
+        default="results.json",
+        help="Results file, .npz (requires numpy) or JSON otherwise",
+    )
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.level_growth is not None and args.level_growth < 0:
+        parser.error("--level-growth cannot be negative")
+
+    settings = {}
+    if args.grid_size is not None:
+        settings["gridSize"] = args.grid_size
+    if args.level_growth is not None:
+        settings["levelGrowth"] = args.level_growth
+    if args.max_grid_size is not None:
+        settings["maxGridSize"] = args.max_grid_size
+    if args.level_progress is not None:
+        settings["levelProgressPercentageRequired"] = args.level_progress
+    if args.wrap:
+        settings["wrapAroundEdges"] = True
+
+    runner = BatchRunner(
+        settings, args.agent, args.max_ticks, args.workers, args.chunk_size
+    )
+    start = time.perf_counter()
+    for finished in runner.run(args.games, args.seed):
+        print("Finished", finished, "of", args.games, "games")
+    elapsed = time.perf_counter() - start
+    runner.writeResults(args.output)
+
+    results = runner.getResults()
+    print(
+        "Played",
+        args.games,
+        "games in",
+        round(elapsed, 2),
+        "seconds.",
+        "Mean length:",
+        round(sum(results["length"]) / args.games, 2),
+        "Highest level:",
+        max(results["level"]),
+    )
+    print("Results written to", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ class Config:
     def __init__(self):
         # display
         self.useTextUI = False
+        self.asyncTextUI = False  # run the text UI on an asyncio event loop
         self.displayWidth = 500
         self.displayHeight = 500
         self.fullscreen = False
@@ -17,17 +18,44 @@ class Config:
         self.red = (255, 0, 0)
         self.yellow = (255, 255, 0)
         self.textSize = 50
+        self.boardRenderer = "cells"  # "cells" or "surface" (requires numpy)
 
         # grid size
         self.gridSize = 5
         self.minGridSize = 5
-        self.maxGridSize = 12
+        self.levelGrowth = 2  # how much wider and taller the grid gets each level
+        # if set, later levels stop growing the grid at this size
+        self.maxGridSize = None
+        self.wrapAroundEdges = False
 
         # tick speed
         self.limitTickSpeed = True
-        self.tickSpeed = 0.1
+        self.tickSpeed = 0.1  # seconds per tick
+        self.framesPerSecond = 30
+        self.maxCatchUpTicks = 5
+        self.inputQueueSize = 3  # direction changes that can wait for later ticks
+
+        # profiling
+        self.profile = False
+        self.profileOutput = "profile.json"
+        self.profileOverlay = True
+
+        # replays
+        self.replayOutput = None  # path to record the game to, None to not record
+
+        # autopilot
+        self.autopilot = None  # name of the agent that steers, None for the keyboard
+        self.autopilotBudget = (
+            0.5  # fraction of each tick that searching agents may think for
+        )
+        self.autopilotWorkers = 0  # worker processes for searching agents, 0 to search in the game's process
+
+        # saves
+        self.saveFile = "ophidian.sav"
 
         # misc
+        self.seed = None  # seeds each game's random numbers, None picks a new seed
+        self.compactEntities = True
         self.debug = False
         self.restartUponCollision = True
         self.levelProgressPercentageRequired = 0.5
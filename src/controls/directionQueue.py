@@ -0,0 +1,43 @@
+from collections import deque
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Holds direction changes that the player pressed but that have not taken
+# effect yet, so that quick turns pressed within one tick are applied one per
+# tick instead of being dropped. Each change is checked against the one
+# queued before it rather than the current direction, so a quick up-then-left
+# is kept while a change that would reverse the ophidian is not. The queue is
+# bounded so that a burst of presses cannot steer the ophidian for long after.
+class DirectionQueue:
+    def __init__(self, capacity=3):
+        self.capacity = capacity
+        self.directions = deque()
+        self.pressTimes = deque()
+
+    def __len__(self):
+        return len(self.directions)
+
+    def clear(self):
+        self.directions.clear()
+        self.pressTimes.clear()
+
+    # Queues a direction pressed at pressTime (in perf_counter_ns). Returns
+    # whether it was queued, which it is not if it repeats or reverses the last
+    # queued direction (or the current one if none is queued), or if the queue is full.
+    def push(self, direction, currentDirection, pressTime):
+        last = self.directions[-1] if self.directions else currentDirection
+        if direction == last or direction == last.getOpposite():
+            return False
+        if len(self.directions) >= self.capacity:
+            return False
+        self.directions.append(direction)
+        self.pressTimes.append(pressTime)
+        return True
+
+    # Removes the next direction change and returns it with its press time, or (None, -1) if there is none.
+    def pop(self):
+        if not self.directions:
+            return None, -1
+        return self.directions.popleft(), self.pressTimes.popleft()
@@ -0,0 +1,335 @@
+import random
+from array import array
+from config.config import Config
+from engine.gameSnapshot import GameSnapshot
+from engine.stepResult import StepResult
+from food.food import Food
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+from lib.pyenvlib.entity import Entity
+from lib.pyenvlib.environment import Environment
+from lib.pyenvlib.location import Location
+from profiling.nullProfiler import NullProfiler
+from snake.snakeBody import SnakeBody
+from snake.snakePart import SnakePart
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Runs the rules of the game without any display, input, sleeping or printing.
+# Front ends feed it an optional direction change each tick through step().
+# Every random choice comes from the engine's own generator, so a game played
+# with the same seed and the same inputs always turns out the same.
+class GameEngine:
+    def __init__(self, config: Config, seed=None):
+        self.config = config
+        if seed is None:
+            seed = config.seed
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.level = 1
+        self.environment = None
+        self.snakeBody = None
+        self.selectedSnakePart = None
+        self.stepResult = StepResult()
+        self.profiler = NullProfiler()
+        self.initialize()
+
+    def getLevel(self):
+        return self.level
+
+    # Sets the level, which takes effect the next time the game is initialized.
+    def setLevel(self, level):
+        self.level = level
+
+    def getScore(self):
+        return self.score
+
+    def getTick(self):
+        return self.tick
+
+    def getSeed(self):
+        return self.seed
+
+    # Starts the random number generator again from a new seed.
+    def setSeed(self, seed):
+        self.seed = seed
+        self.random.seed(seed)
+
+    def getRandom(self):
+        return self.random
+
+    def getEnvironment(self):
+        return self.environment
+
+    def getSnakeBody(self):
+        return self.snakeBody
+
+    def getSelectedSnakePart(self):
+        return self.selectedSnakePart
+
+    def hasCollided(self):
+        return self.collision
+
+    # Sets the profiler that the moveEntity and spawnFood phases are timed with.
+    def setProfiler(self, profiler):
+        self.profiler = profiler
+
+    # Returns the width and height of the grid for the current level. The grid
+    # grows by levelGrowth each level, up to maxGridSize if the config sets one.
+    def getGridSize(self):
+        size = self.config.gridSize + (self.level - 1) * self.config.levelGrowth
+        if self.config.maxGridSize is None:
+            return size
+        return max(self.config.gridSize, min(size, self.config.maxGridSize))
+
+    # Returns the fraction of the world that the ophidian takes up.
+    def getProgress(self):
+        return len(self.snakeBody) / self.environment.getGrid().getSize()
+
+    def hasReachedLevelProgressRequired(self):
+        return self.getProgress() > self.config.levelProgressPercentageRequired
+
+    # Returns whether the ophidian may turn to the given direction, which it cannot do if that would reverse it.
+    def isValidDirectionChange(self, direction):
+        return self.selectedSnakePart.getDirection() != direction.getOpposite()
+
+    # Advances the game by one tick, first applying the given direction change if it is valid.
+    def step(self, direction=None):
+        self.stepResult = StepResult()
+        if direction is not None and self.isValidDirectionChange(direction):
+            self.selectedSnakePart.setDirection(direction)
+        timer = self.profiler.startTimer()
+        self.moveEntity(self.selectedSnakePart, self.selectedSnakePart.getDirection())
+        self.profiler.stopTimer("moveEntity", timer)
+        self.tick += 1
+        return self.stepResult
+
+    def calculateScore(self):
+        length = len(self.snakeBody)
+        percentage = int(self.getProgress() * 100)
+        self.score = length * percentage
+
+    # Moves on to the next level if enough progress was made, then starts the level again.
+    # Returns whether the level changed.
+    def checkForLevelProgressAndReinitialize(self):
+        progressed = self.hasReachedLevelProgressRequired()
+        if progressed:
+            self.level += 1
+        self.initialize()
+        return progressed
+
+    def getLocation(self, entity: Entity):
+        locationID = entity.getLocationID()
+        grid = self.environment.getGrid()
+        return grid.getLocation(locationID)
+
+    def getLocationAndGrid(self, entity: Entity):
+        locationID = entity.getLocationID()
+        grid = self.environment.getGrid()
+        return grid, grid.getLocation(locationID)
+
+    def moveEntity(self, entity: Entity, direction):
+        grid, location = self.getLocationAndGrid(entity)
+
+        newLocation = grid.getNeighbour(location, direction)
+
+        if newLocation == -1:
+            # location doesn't exist, we're at a border
+            return
+
+        cellState = grid.getCellState(newLocation)
+
+        # if new location has a snake part already
+        if cellState == CellState.SNAKE:
+            # we have a collision
+            self.collision = True
+            self.stepResult.collided = True
+            return
+
+        # move entity
+        location.removeEntity(entity)
+        newLocation.addEntity(entity)
+        entity.lastPosition = location
+        vacatedLocation = location
+        self.stepResult.moved = True
+        self.stepResult.changedLocations.append(location)
+        self.stepResult.changedLocations.append(newLocation)
+
+        # move the tail into the location the head just left
+        if entity.hasPrevious():
+            vacatedLocation = self.moveTailBehindHead(location)
+
+        # check for food
+        if cellState != CellState.FOOD:
+            return
+
+        food = -1
+        for e in newLocation.getEntities().values():
+            if type(e) is Food:
+                food = e
+
+        foodColor = food.getColor()
+
+        self.removeEntity(food)
+        self.spawnSnakePart(vacatedLocation, foodColor)
+        self.stepResult.ateFood = True
+        if not self.spawnFood():
+            self.stepResult.boardFull = True
+        self.calculateScore()
+
+    # Moves the tail part into the target location and returns the location it vacated.
+    def moveTailBehindHead(self, targetLocation):
+        tail = self.snakeBody.advance()
+        tailLocation = self.getLocation(tail)
+
+        tailLocation.removeEntity(tail)
+        targetLocation.addEntity(tail)
+        tail.lastPosition = tailLocation
+        self.stepResult.changedLocations.append(tailLocation)
+        return tailLocation
+
+    def removeEntityFromLocation(self, entity: Entity):
+        location = self.getLocation(entity)
+        if location.isEntityPresent(entity):
+            location.removeEntity(entity)
+
+    def removeEntity(self, entity: Entity):
+        self.removeEntityFromLocation(entity)
+
+    def generateColor(self):
+        return (
+            self.random.randrange(50, 200),
+            self.random.randrange(50, 200),
+            self.random.randrange(50, 200),
+        )
+
+    def spawnSnakePart(self, targetLocation: Location, color):
+        newSnakePart = SnakePart(color)
+        self.environment.addEntityToLocation(newSnakePart, targetLocation)
+        self.snakeBody.append(newSnakePart)
+        self.stepResult.changedLocations.append(targetLocation)
+
+    # Places food in a random empty location. Returns False if there was no room for it.
+    def spawnFood(self):
+        timer = self.profiler.startTimer()
+        food = Food(self.generateColor())
+
+        # get target location
+        targetLocation = self.environment.getGrid().getRandomEmptyLocation(self.random)
+        if targetLocation == -1:
+            self.profiler.stopTimer("spawnFood", timer)
+            return False
+
+        self.environment.addEntityToLocation(food, targetLocation)
+        self.stepResult.changedLocations.append(targetLocation)
+        self.profiler.stopTimer("spawnFood", timer)
+        return True
+
+    def initialize(self):
+        self.collision = False
+        self.score = 0
+        self.tick = 0
+        size = self.getGridSize()
+        if self.environment is None:
+            self.environment = Environment(
+                "Level " + str(self.level), size, self.config.wrapAroundEdges
+            )
+        else:
+            # reuse the existing grid so that only occupied and newly added locations are touched
+            grid = self.environment.getGrid()
+            if grid.getColumns() == size and grid.getRows() == size:
+                grid.clear()
+            else:
+                grid.resize(size, size)
+            self.environment.setName("Level " + str(self.level))
+        self.selectedSnakePart = SnakePart(self.generateColor())
+        self.environment.addEntity(self.selectedSnakePart, self.random)
+        self.snakeBody = SnakeBody(self.selectedSnakePart)
+        self.spawnFood()
+
+    # Captures the whole state of the game so that it can be restored later.
+    def snapshot(self):
+        grid = self.environment.getGrid()
+        columns = grid.getColumns()
+        body = array("i")
+        colors = bytearray()
+        for part in self.snakeBody:
+            location = grid.getLocation(part.getLocationID())
+            body.append(location.getY() * columns + location.getX())
+            colors.extend(part.getColor())
+
+        cellStates = bytes(grid.getCellStates())
+        foodColors = bytearray()
+        index = cellStates.find(CellState.FOOD)
+        while index != -1:
+            for entity in grid.getLocationByIndex(index).getEntities().values():
+                if type(entity) is Food:
+                    foodColors.extend(entity.getColor())
+            index = cellStates.find(CellState.FOOD, index + 1)
+
+        return GameSnapshot(
+            columns,
+            grid.getRows(),
+            self.level,
+            self.score,
+            self.tick,
+            self.selectedSnakePart.getDirection(),
+            self.collision,
+            cellStates,
+            body,
+            bytes(colors),
+            bytes(foodColors),
+            self.random.getstate(),
+        )
+
+    # Puts the game back into the state captured by a snapshot, reusing the grid.
+    # Everything that can reject the snapshot runs before any state is changed.
+    def restore(self, snapshot: GameSnapshot):
+        randomState = snapshot.getRandomState()
+        random.Random().setstate(randomState)
+        headDirection = Direction(snapshot.getHeadDirection())
+
+        self.level = snapshot.getLevel()
+        self.score = snapshot.getScore()
+        self.tick = snapshot.getTick()
+        self.collision = snapshot.hasCollided()
+        self.random.setstate(randomState)
+        self.stepResult = StepResult()
+
+        grid = self.environment.getGrid()
+        columns = snapshot.getColumns()
+        rows = snapshot.getRows()
+        if grid.getColumns() == columns and grid.getRows() == rows:
+            grid.clear()
+        else:
+            grid.resize(columns, rows)
+        self.environment.setName("Level " + str(self.level))
+
+        colors = snapshot.getColors()
+        body = snapshot.getBody()
+        self.selectedSnakePart = SnakePart(tuple(colors[0:3]))
+        self.selectedSnakePart.setDirection(headDirection)
+        self.environment.addEntityToLocation(
+            self.selectedSnakePart, grid.getLocationByIndex(body[0])
+        )
+        self.snakeBody = SnakeBody(self.selectedSnakePart)
+        for position in range(1, len(body)):
+            part = SnakePart(tuple(colors[position * 3 : position * 3 + 3]))
+            self.environment.addEntityToLocation(
+                part, grid.getLocationByIndex(body[position])
+            )
+            self.snakeBody.append(part)
+
+        cellStates = snapshot.getCellStates()
+        foodColors = snapshot.getFoodColors()
+        position = 0
+        index = cellStates.find(CellState.FOOD)
+        while index != -1:
+            food = Food(tuple(foodColors[position : position + 3]))
+            self.environment.addEntityToLocation(food, grid.getLocationByIndex(index))
+            position += 3
+            index = cellStates.find(CellState.FOOD, index + 1)
@@ -0,0 +1,225 @@
+import struct
+import sys
+from array import array
+from lib.pyenvlib.cellState import CellState
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# The complete state of a GameEngine, packed into flat buffers instead of an
+# object graph. The board is kept as its cell states. The ophidian is kept as
+# the location indices of its parts from head to tail, with three colour bytes
+# per part. Food is found from the cell states, with three colour bytes per food
+# cell in index order. Numbers are stored little-endian on every machine.
+# Snapshots are immutable, so one can be restored any number of times.
+class GameSnapshot:
+    MAGIC = b"OPHS"
+    VERSION = 1
+    HEADER = struct.Struct("<BIIIqqB?II")
+    RANDOM_HEADER = struct.Struct("<Bd?")
+    RANDOM_WORDS = 625
+
+    def __init__(
+        self,
+        columns,
+        rows,
+        level,
+        score,
+        tick,
+        headDirection,
+        collision,
+        cellStates,
+        body,
+        colors,
+        foodColors,
+        randomState,
+    ):
+        self.columns = columns
+        self.rows = rows
+        self.level = level
+        self.score = score
+        self.tick = tick
+        self.headDirection = headDirection
+        self.collision = collision
+        self.cellStates = cellStates
+        self.body = body
+        self.colors = colors
+        self.foodColors = foodColors
+        self.randomState = randomState
+
+    def getColumns(self):
+        return self.columns
+
+    def getRows(self):
+        return self.rows
+
+    def getLevel(self):
+        return self.level
+
+    def getScore(self):
+        return self.score
+
+    def getTick(self):
+        return self.tick
+
+    def getHeadDirection(self):
+        return self.headDirection
+
+    def hasCollided(self):
+        return self.collision
+
+    # Returns the cell states of the board in row-major order, as bytes.
+    def getCellStates(self):
+        return self.cellStates
+
+    # Returns the location indices of the ophidian's parts from head to tail.
+    def getBody(self):
+        return self.body
+
+    # Returns the colour of each part, three bytes per part.
+    def getColors(self):
+        return self.colors
+
+    # Returns the colour of each food cell in index order, three bytes per food.
+    def getFoodColors(self):
+        return self.foodColors
+
+    def getRandomState(self):
+        return self.randomState
+
+    def toBytes(self):
+        version, words, gaussNext = self.randomState
+        header = self.HEADER.pack(
+            self.VERSION,
+            self.columns,
+            self.rows,
+            self.level,
+            self.score,
+            self.tick,
+            self.headDirection,
+            self.collision,
+            len(self.body),
+            len(self.foodColors) // 3,
+        )
+        return b"".join(
+            (
+                self.MAGIC,
+                header,
+                self.cellStates,
+                self.toLittleEndian(self.body),
+                self.colors,
+                self.foodColors,
+                self.RANDOM_HEADER.pack(
+                    version, gaussNext or 0.0, gaussNext is not None
+                ),
+                self.toLittleEndian(array("I", words)),
+            )
+        )
+
+    # Returns the bytes of an array in little-endian order, like the rest of the
+    # file, so that saves can be moved between machines.
+    @staticmethod
+    def toLittleEndian(values):
+        if sys.byteorder == "big":
+            values = array(values.typecode, values)
+            values.byteswap()
+        return values.tobytes()
+
+    # Parses a snapshot written by toBytes, raising ValueError for anything that
+    # is not a complete, well-formed save.
+    @staticmethod
+    def fromBytes(data):
+        if data[:4] != GameSnapshot.MAGIC:
+            raise ValueError("not an ophidian save")
+        header = GameSnapshot.HEADER
+        try:
+            (
+                version,
+                columns,
+                rows,
+                level,
+                score,
+                tick,
+                headDirection,
+                collision,
+                bodyLength,
+                foodCount,
+            ) = header.unpack_from(data, 4)
+        except struct.error:
+            raise ValueError("save is truncated") from None
+        if version != GameSnapshot.VERSION:
+            raise ValueError("unsupported save version " + str(version))
+        if columns == 0 or rows == 0 or bodyLength == 0:
+            raise ValueError("save has an empty board or ophidian")
+        if headDirection >= 4:
+            raise ValueError("save has an unknown head direction")
+
+        body = array("i")
+        size = columns * rows
+        expected = (
+            4
+            + header.size
+            + size
+            + bodyLength * (body.itemsize + 3)
+            + foodCount * 3
+            + GameSnapshot.RANDOM_HEADER.size
+            + GameSnapshot.RANDOM_WORDS * array("I").itemsize
+        )
+        if len(data) != expected:
+            raise ValueError("save is truncated or has trailing data")
+
+        offset = 4 + header.size
+        cellStates = bytes(data[offset : offset + size])
+        offset += size
+        if cellStates.count(CellState.FOOD) != foodCount:
+            raise ValueError("save has the wrong number of food colours")
+        body.frombytes(data[offset : offset + bodyLength * body.itemsize])
+        if sys.byteorder == "big":
+            body.byteswap()
+        offset += bodyLength * body.itemsize
+        if min(body) < 0 or max(body) >= size:
+            raise ValueError("save has an ophidian part outside the board")
+        colors = bytes(data[offset : offset + bodyLength * 3])
+        offset += bodyLength * 3
+        foodColors = bytes(data[offset : offset + foodCount * 3])
+        offset += foodCount * 3
+        randomVersion, gaussNext, hasGaussNext = GameSnapshot.RANDOM_HEADER.unpack_from(
+            data, offset
+        )
+        offset += GameSnapshot.RANDOM_HEADER.size
+        words = array("I")
+        words.frombytes(data[offset:])
+        if sys.byteorder == "big":
+            words.byteswap()
+        # the last word is the Mersenne Twister's position in its 624 word state
+        if randomVersion != 3 or words[-1] > GameSnapshot.RANDOM_WORDS - 1:
+            raise ValueError("save has an invalid random state")
+        randomState = (
+            randomVersion,
+            tuple(words),
+            gaussNext if hasGaussNext else None,
+        )
+        return GameSnapshot(
+            columns,
+            rows,
+            level,
+            score,
+            tick,
+            headDirection,
+            collision,
+            cellStates,
+            body,
+            colors,
+            foodColors,
+            randomState,
+        )
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.toBytes())
+
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as file:
+            return GameSnapshot.fromBytes(file.read())
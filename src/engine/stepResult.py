@@ -0,0 +1,27 @@
+# @author agent
+# @since October 17th, 2026
+#
+# Describes what happened during a single tick of the game engine.
+class StepResult:
+    def __init__(self):
+        self.moved = False
+        self.collided = False
+        self.ateFood = False
+        self.boardFull = False
+        self.changedLocations = []
+
+    def hasMoved(self):
+        return self.moved
+
+    def hasCollided(self):
+        return self.collided
+
+    def hasEatenFood(self):
+        return self.ateFood
+
+    def isBoardFull(self):
+        return self.boardFull
+
+    # Returns the locations whose contents changed during the tick, possibly with repeats.
+    def getChangedLocations(self):
+        return self.changedLocations
@@ -1,9 +1,14 @@
+from lib.pyenvlib.cellState import CellState
 from lib.pyenvlib.entity import Entity
 
 
 # @author Daniel McCoy Stephenson
 # @since August 6th, 2022
 class Food(Entity):
+    cellState = CellState.FOOD
+
+    __slots__ = ("color",)
+
     def __init__(self, color):
         Entity.__init__(self, "Food")
         self.color = color
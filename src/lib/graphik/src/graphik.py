@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import pygame
 
 
@@ -15,8 +17,15 @@ class Graphik:
         self.green = (0, 200, 0)
         self.blue = (0, 0, 200)
 
-    def __init__(self, gameDisplay):
+    def __init__(self, gameDisplay, textCacheSize=256):
         self.gameDisplay = gameDisplay
+        self.fonts = {}
+        self.textSurfaces = OrderedDict()
+        self.textCacheSize = textCacheSize
+        self.fontHits = 0
+        self.fontMisses = 0
+        self.textHits = 0
+        self.textMisses = 0
 
     def getGameDisplay(self):
         return self.gameDisplay
@@ -27,9 +36,45 @@ class Graphik:
     def drawRectangle(self, xpos, ypos, width, height, color):
         pygame.draw.rect(self.gameDisplay, color, [xpos, ypos, width, height])
 
+    # returns the font for a face and size, loading it only the first time it is needed
+    def getFont(self, size, face="freesansbold.ttf"):
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.fontMisses += 1
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+        else:
+            self.fontHits += 1
+        return font
+
+    # returns the rendered surface for some text, keeping the most recently used ones cached
+    def getTextSurface(self, text, size, color):
+        key = (text, size, tuple(color))
+        textSurface = self.textSurfaces.get(key)
+        if textSurface is not None:
+            self.textHits += 1
+            self.textSurfaces.move_to_end(key)
+            return textSurface
+
+        self.textMisses += 1
+        textSurface = self.getFont(size).render(text, True, color)
+        self.textSurfaces[key] = textSurface
+        if len(self.textSurfaces) > self.textCacheSize:
+            self.textSurfaces.popitem(last=False)
+        return textSurface
+
+    def getCacheStats(self):
+        return {
+            "fontHits": self.fontHits,
+            "fontMisses": self.fontMisses,
+            "textHits": self.textHits,
+            "textMisses": self.textMisses,
+            "cachedTextSurfaces": len(self.textSurfaces),
+        }
+
     def drawText(self, text, xpos, ypos, size, color):
-        myFont = pygame.font.Font("freesansbold.ttf", size)
-        textSurface = myFont.render(text, True, color)
+        textSurface = self.getTextSurface(text, size, color)
         textRectangle = textSurface.get_rect()
         textRectangle.center = (xpos, ypos)
         self.gameDisplay.blit(textSurface, textRectangle)
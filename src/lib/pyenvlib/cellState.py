@@ -0,0 +1,15 @@
+# Copyright (c) 2022 Preponderous Software
+# MIT License
+from enum import IntEnum
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Represents what occupies a location, stored as a single byte per location in a grid.
+class CellState(IntEnum):
+    EMPTY = 0
+    OCCUPIED = 1
+    SNAKE = 2
+    FOOD = 3
+    WALL = 4
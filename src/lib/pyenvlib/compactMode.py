@@ -0,0 +1,41 @@
+# Copyright (c) 2022 Preponderous Software
+# MIT License
+import datetime
+import itertools
+import uuid
+
+# @author agent
+# @since October 17th, 2026
+#
+# Controls how pyenvlib objects identify themselves. By default every object
+# gets a random UUID and a creation timestamp. In compact mode, IDs come from a
+# monotonically increasing integer counter and creation dates are not recorded,
+# which makes building large grids much cheaper.
+
+compactMode = False
+idCounter = itertools.count(1)
+
+
+# Enables or disables compact mode for objects created from now on.
+def setCompactMode(enabled):
+    global compactMode
+    compactMode = enabled
+
+
+# Returns whether compact mode is enabled.
+def isCompactMode():
+    return compactMode
+
+
+# Returns a new ID for an object.
+def generateID():
+    if compactMode:
+        return next(idCounter)
+    return uuid.uuid4()
+
+
+# Returns the creation date for a new object, or None in compact mode.
+def generateCreationDate():
+    if compactMode:
+        return None
+    return datetime.datetime.now()
@@ -0,0 +1,18 @@
+# Copyright (c) 2022 Preponderous Software
+# MIT License
+from enum import IntEnum
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Represents one of the four directions that can be travelled in a grid.
+class Direction(IntEnum):
+    UP = 0
+    LEFT = 1
+    DOWN = 2
+    RIGHT = 3
+
+    # Returns the direction pointing the opposite way.
+    def getOpposite(self):
+        return Direction((self + 2) % 4)
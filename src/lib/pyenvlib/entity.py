@@ -1,7 +1,7 @@
 # Copyright (c) 2022 Preponderous Software
 # MIT License
-import datetime
-import uuid
+from lib.pyenvlib import compactMode
+from lib.pyenvlib.cellState import CellState
 
 
 # @author Daniel McCoy Stephenson
@@ -9,10 +9,22 @@ import uuid
 #
 # Represents an entity that can exist in a location.
 class Entity(object):
+    # The state recorded in a grid's occupancy layer for locations that this entity is on top of.
+    cellState = CellState.OCCUPIED
+
+    __slots__ = (
+        "id",
+        "name",
+        "creationDate",
+        "environmentID",
+        "gridID",
+        "locationID",
+    )
+
     def __init__(self, name):
-        self.id = uuid.uuid4()
+        self.id = compactMode.generateID()
         self.name = name
-        self.creationDate = datetime.datetime.now()
+        self.creationDate = compactMode.generateCreationDate()
         self.environmentID = -1
         self.gridID = -1
         self.locationID = -1
@@ -41,6 +53,10 @@ class Entity(object):
     def getLocationID(self):
         return self.locationID
 
+    # Returns the cell state that this entity marks its location with.
+    def getCellState(self):
+        return self.cellState
+
     # Sets the ID of this entity.
     def setID(self, id):
         self.id = id
@@ -1,21 +1,21 @@
 # Copyright (c) 2022 Preponderous Software
 # MIT License
-import datetime
-import uuid
+import random
+from lib.pyenvlib import compactMode
 from lib.pyenvlib.entity import Entity
 from lib.pyenvlib.grid import Grid
 
-
 # @author Daniel McCoy Stephenson
 # @since July 1st, 2022
 
+
 # Represents a virtual environment with an underlying 2D grid of locations that can contain entities.
 class Environment(object):
-    def __init__(self, name, size):
-        self.id = uuid.uuid4()
+    def __init__(self, name, size, wrap=False):
+        self.id = compactMode.generateID()
         self.name = name
-        self.grid = Grid(size, size)
-        self.creationDate = datetime.datetime.now()
+        self.grid = Grid(size, size, wrap)
+        self.creationDate = compactMode.generateCreationDate()
 
     # Returns the ID of this environment.
     def getID(self):
@@ -45,10 +45,10 @@ class Environment(object):
     def setGrid(self, grid):
         self.grid = grid
 
-    # Adds an entity to the underlying grid.
-    def addEntity(self, entity: Entity):
+    # Adds an entity to a random location in the underlying grid, drawn from the given random number generator.
+    def addEntity(self, entity: Entity, rng=random):
         entity.setEnvironmentID(self.getID())
-        self.grid.addEntity(entity)
+        self.grid.addEntity(entity, rng)
 
     # Adds an entity to a particular location in the underlying grid of this environment.
     def addEntityToLocation(self, entity: Entity, location):
@@ -1,7 +1,10 @@
 # Copyright (c) 2022 Preponderous Software
 # MIT License
 import random
-import uuid
+from array import array
+from lib.pyenvlib import compactMode
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
 from lib.pyenvlib.entity import Entity
 from lib.pyenvlib.location import Location
 
@@ -11,12 +14,17 @@ from lib.pyenvlib.location import Location
 #
 # Represents a grid of locations.
 class Grid(object):
-    def __init__(self, columns, rows):
-        self.id = uuid.uuid4()
+    def __init__(self, columns, rows, wrap=False):
+        self.id = compactMode.generateID()
         self.columns = columns
         self.rows = rows
+        self.wrap = wrap
         self.locations = dict()
+        self.locationIndex = []
+        self.entityLocations = dict()
+        self.numEntities = 0
         self.generateLocations()
+        self.generateNeighbourTable()
 
     # Returns the ID of this grid.
     def getID(self):
@@ -30,6 +38,10 @@ class Grid(object):
     def getRows(self):
         return self.rows
 
+    # Returns whether the edges of this grid wrap around to the opposite side.
+    def isWrapping(self):
+        return self.wrap
+
     # Returns the list of locations in this grid.
     def getLocations(self):
         return self.locations
@@ -44,11 +56,7 @@ class Grid(object):
 
     # Returns the number of entities in this grid.
     def getNumEntities(self):
-        count = 0
-        for locationId in self.locations:
-            location = self.locations[locationId]
-            count += location.getNumEntities()
-        return count
+        return self.numEntities
 
     # Sets the ID of this grid.
     def setID(self, id):
@@ -65,95 +73,282 @@ class Grid(object):
     # Sets the locations for this grid.
     def setLocations(self, locations):
         self.locations = locations
+        count = self.columns * self.rows
+        self.locationIndex = [-1] * count
+        self.cellStates = bytearray(count)
+        self.emptyLocations = array("i")
+        self.emptyPositions = array("i", [-1]) * count
+        self.entityLocations = dict()
+        self.numEntities = 0
+        for locationId in self.locations:
+            self.indexLocation(self.locations[locationId])
 
     # Adds a location to this grid.
     def addLocation(self, location: Location):
         self.locations[location.getID()] = location
+        self.indexLocation(location)
 
     # Removes a location from this grid.
     def removeLocation(self, location: Location):
-        self.locations.remove(location)
+        del self.locations[location.getID()]
+        index = self.getIndex(location.getX(), location.getY())
+        if index != -1 and self.locationIndex[index] is location:
+            self.locationIndex[index] = -1
+            self.cellStates[index] = CellState.EMPTY
+            self.markOccupied(index)
+            for entityId in location.getEntities():
+                del self.entityLocations[entityId]
+            self.numEntities -= location.getNumEntities()
+            location.setGrid(-1)
+
+    # Returns the position of the specified coordinates in the coordinate index, or -1 if they are out of bounds.
+    def getIndex(self, x, y):
+        if x < 0 or y < 0 or x >= self.columns or y >= self.rows:
+            return -1
+        return y * self.columns + x
+
+    # Records a location in the coordinate index so that it can be found by its coordinates.
+    def indexLocation(self, location: Location):
+        index = self.getIndex(location.getX(), location.getY())
+        if index != -1:
+            self.locationIndex[index] = location
+            location.setGrid(self)
+            for entityId in location.getEntities():
+                self.entityLocations[entityId] = location
+            self.numEntities += location.getNumEntities()
+            if location.getNumEntities() == 0:
+                self.cellStates[index] = CellState.EMPTY
+                self.markEmpty(index)
+            else:
+                topEntity = next(reversed(location.getEntities().values()))
+                self.cellStates[index] = topEntity.getCellState()
+                self.markOccupied(index)
+
+    # Called by a location in this grid after an entity has been added to it.
+    def notifyEntityAdded(self, location: Location, entity: Entity):
+        self.entityLocations[entity.getID()] = location
+        self.numEntities += 1
+        index = location.getY() * self.columns + location.getX()
+        self.cellStates[index] = entity.getCellState()
+        if location.getNumEntities() == 1:
+            self.markOccupied(index)
+
+    # Called by a location in this grid after an entity has been removed from it.
+    def notifyEntityRemoved(self, location: Location, entity: Entity):
+        del self.entityLocations[entity.getID()]
+        self.numEntities -= 1
+        index = location.getY() * self.columns + location.getX()
+        if location.getNumEntities() == 0:
+            self.cellStates[index] = CellState.EMPTY
+            self.markEmpty(index)
+        else:
+            topEntity = next(reversed(location.getEntities().values()))
+            self.cellStates[index] = topEntity.getCellState()
+
+    # Returns the occupancy layer, holding the cell state of the top entity at each location index.
+    def getCellStates(self):
+        return self.cellStates
+
+    # Returns the cell state of the specified location.
+    def getCellState(self, location: Location):
+        return self.cellStates[location.getY() * self.columns + location.getX()]
+
+    # Adds a location index to the set of empty locations.
+    def markEmpty(self, index):
+        if self.emptyPositions[index] != -1:
+            return
+        self.emptyPositions[index] = len(self.emptyLocations)
+        self.emptyLocations.append(index)
+
+    # Removes a location index from the set of empty locations by swapping it with the last one.
+    def markOccupied(self, index):
+        position = self.emptyPositions[index]
+        if position == -1:
+            return
+        last = self.emptyLocations.pop()
+        if last != index:
+            self.emptyLocations[position] = last
+            self.emptyPositions[last] = position
+        self.emptyPositions[index] = -1
 
-    # Adds an entity to a random location in this grid.
-    def addEntity(self, entity: Entity):
+    # Adds an entity to a random location in this grid, drawn from the given random number generator.
+    def addEntity(self, entity: Entity, rng=random):
         entity.setGridID(self.getID())
-        self.getRandomLocation().addEntity(entity)
+        self.getRandomLocation(rng).addEntity(entity)
 
     # Adds an entity to a specified location in this grid.
     def addEntityToLocation(self, entity: Entity, location):
-        entity.setGridID(self.getID)
+        entity.setGridID(self.getID())
 
         self.locations[location.getID()].addEntity(entity)
 
     # Removes an entity from this grid.
     def removeEntity(self, entity: Entity):
-        for locationId in self.getLocations():
-            location = self.locations[locationId]
-            if location.isEntityPresent(entity):
-                location.removeEntity(entity)
-                return
+        location = self.entityLocations.get(entity.getID())
+        if location is not None:
+            location.removeEntity(entity)
 
     # Checks if an entity is present in this grid.
     def isEntityPresent(self, entity: Entity):
-        for locationId in self.grid.getLocations():
-            location = self.locations[locationId]
-            if location.isEntityPresent(entity):
-                return True
+        return entity.getID() in self.entityLocations
+
+    # Returns the map of entity IDs to the locations that those entities are in.
+    def getEntityLocations(self):
+        return self.entityLocations
+
+    # Returns the location that an entity is in, or -1 if it is not in this grid.
+    def getLocationOfEntity(self, entity: Entity):
+        return self.entityLocations.get(entity.getID(), -1)
 
     # Generates the locations based on the columns and rows. Assumes an empty locations array.
     def generateLocations(self):
-        for x in range(self.getColumns()):
-            for y in range(self.getRows()):
-                location = Location(x, y)
+        self.locationIndex = [
+            Location(x, y, self) for y in range(self.rows) for x in range(self.columns)
+        ]
+        self.locations.update(
+            (location.getID(), location) for location in self.locationIndex
+        )
+        self.resetCellLayers()
+
+    # Marks every location as empty in the occupancy layer and the set of empty locations.
+    def resetCellLayers(self):
+        count = self.columns * self.rows
+        self.cellStates = bytearray(count)
+        self.emptyLocations = array("i", range(count))
+        self.emptyPositions = self.emptyLocations[:]
+
+    # Precomputes the index of each location's neighbour in every direction, using -1 where there is none.
+    def generateNeighbourTable(self):
+        columns = self.columns
+        rows = self.rows
+        count = columns * rows
+        firstRow = array("i", [-1]) * columns
+        lastRow = array("i", [-1]) * columns
+        firstColumn = array("i", [-1]) * rows
+        lastColumn = array("i", [-1]) * rows
+        if self.wrap:
+            firstRow = array("i", range(count - columns, count))
+            lastRow = array("i", range(0, columns))
+            firstColumn = array("i", range(columns - 1, count, columns))
+            lastColumn = array("i", range(0, count, columns))
+
+        # every neighbour index is an offset of the location index, so all four
+        # directions can be sliced out of one shared range
+        indices = array("i", range(-columns, count + columns))
+        up = indices[0:count]
+        up[0:columns] = firstRow
+        left = indices[columns - 1 : columns - 1 + count]
+        left[0::columns] = firstColumn
+        down = indices[2 * columns : 2 * columns + count]
+        down[count - columns : count] = lastRow
+        right = indices[columns + 1 : columns + 1 + count]
+        right[columns - 1 :: columns] = lastColumn
+
+        self.neighbours = array("i", [-1]) * (count * 4)
+        self.neighbours[Direction.UP :: 4] = up
+        self.neighbours[Direction.LEFT :: 4] = left
+        self.neighbours[Direction.DOWN :: 4] = down
+        self.neighbours[Direction.RIGHT :: 4] = right
+
+    # Removes every entity from this grid, touching only the locations that are occupied.
+    def clear(self):
+        for entityId, location in list(self.entityLocations.items()):
+            location.removeEntity(location.getEntities()[entityId])
+
+    # Clears this grid and changes its size, keeping the locations that are still in bounds so that only new locations are created.
+    def resize(self, columns, rows):
+        self.clear()
+        oldColumns = self.columns
+        oldRows = self.rows
+        oldIndex = self.locationIndex
+
+        locationIndex = []
+        for y in range(rows):
+            keptColumns = 0
+            if y < oldRows:
+                keptColumns = min(columns, oldColumns)
+                start = y * oldColumns
+                locationIndex.extend(oldIndex[start : start + keptColumns])
+            for x in range(keptColumns, columns):
+                location = Location(x, y, self)
                 self.locations[location.getID()] = location
+                locationIndex.append(location)
+
+        if columns < oldColumns or rows < oldRows:
+            for location in oldIndex:
+                if location.getX() >= columns or location.getY() >= rows:
+                    del self.locations[location.getID()]
+                    location.setGrid(-1)
+
+        self.columns = columns
+        self.rows = rows
+        self.locationIndex = locationIndex
+        self.resetCellLayers()
+        self.generateNeighbourTable()
+
+    # Returns the neighbour table, holding four neighbour indices (up, left, down, right) per location index.
+    def getNeighbourTable(self):
+        return self.neighbours
+
+    # Returns the neighbour of the specified location in the specified direction, or -1 if there is none.
+    def getNeighbour(self, location: Location, direction):
+        if location == -1:
+            return -1
+        index = self.neighbours[
+            (location.getY() * self.columns + location.getX()) * 4 + direction
+        ]
+        if index == -1:
+            return -1
+        return self.locationIndex[index]
 
     # Returns a location with the specified ID.
     def getLocation(self, id):
         return self.locations[id]
 
-    # Returns a random location.
-    def getRandomLocation(self):
-        index = random.randrange(0, len(self.locations))
-        id = list(self.locations.keys())[index]
-        return self.locations[id]
+    # Returns a random location, drawn from the given random number generator.
+    def getRandomLocation(self, rng=random):
+        return self.locationIndex[rng.randrange(0, len(self.locationIndex))]
+
+    # Returns a random location that contains no entities, or -1 if every location is occupied.
+    def getRandomEmptyLocation(self, rng=random):
+        if len(self.emptyLocations) == 0:
+            return -1
+        index = self.emptyLocations[rng.randrange(0, len(self.emptyLocations))]
+        return self.locationIndex[index]
+
+    # Returns the number of locations that contain no entities.
+    def getNumEmptyLocations(self):
+        return len(self.emptyLocations)
+
+    # Returns the location at the specified position in the coordinate index.
+    def getLocationByIndex(self, index):
+        return self.locationIndex[index]
 
     # Returns a location at the specified coordinates.
     def getLocationByCoordinates(self, x, y):
-        for locationId in self.locations:
-            location = self.locations[locationId]
-            if location.getX() == x and location.getY() == y:
-                return location
-        return -1
+        if x < 0 or y < 0 or x >= self.columns or y >= self.rows:
+            return -1
+        return self.locationIndex[y * self.columns + x]
 
     # Returns the location above the specified location.
     def getUp(self, location: Location):
-        if location == -1:
-            return -1
-        return self.getLocationByCoordinates(location.getX(), location.getY() - 1)
+        return self.getNeighbour(location, Direction.UP)
 
     # Returns the location to the right of the specified location.
     def getRight(self, location: Location):
-        if location == -1:
-            return -1
-        return self.getLocationByCoordinates(location.getX() + 1, location.getY())
+        return self.getNeighbour(location, Direction.RIGHT)
 
     # Returns the location underneath the specified location.
     def getDown(self, location: Location):
-        if location == -1:
-            return -1
-        return self.getLocationByCoordinates(location.getX(), location.getY() + 1)
+        return self.getNeighbour(location, Direction.DOWN)
 
     # Returns the location to the left of the specified location.
     def getLeft(self, location: Location):
-        if location == -1:
-            return -1
-        return self.getLocationByCoordinates(location.getX() - 1, location.getY())
+        return self.getNeighbour(location, Direction.LEFT)
 
     # Returns the entity with the specified ID.
     def getEntity(self, id):
-        for locationId in self.locations:
-            location = self.locations[locationId]
-            entity = location.getEntity(id)
-            if entity != None:
-                return entity
-        return None
+        location = self.entityLocations.get(id)
+        if location is None:
+            return None
+        return location.getEntity(id)
@@ -1,6 +1,6 @@
 # Copyright (c) 2022 Preponderous Software
 # MIT License
-import uuid
+from lib.pyenvlib import compactMode
 from lib.pyenvlib.entity import Entity
 
 
@@ -9,11 +9,14 @@ from lib.pyenvlib.entity import Entity
 #
 # Represents a location that can contain entities.
 class Location(object):
-    def __init__(self, x, y):
-        self.id = uuid.uuid4()
+    __slots__ = ("id", "x", "y", "entities", "grid")
+
+    def __init__(self, x, y, grid=-1):
+        self.id = compactMode.generateID()
         self.x = x
         self.y = y
         self.entities = dict()
+        self.grid = grid
 
     # Returns the ID of this location.
     def getID(self):
@@ -27,6 +30,14 @@ class Location(object):
     def getY(self):
         return self.y
 
+    # Returns the grid that this location belongs to, or -1 if it has none.
+    def getGrid(self):
+        return self.grid
+
+    # Sets the grid that this location belongs to. The grid is notified whenever an entity is added or removed.
+    def setGrid(self, grid):
+        self.grid = grid
+
     # Returns the number of entities in this location.
     def getNumEntities(self):
         return len(self.entities)
@@ -36,6 +47,8 @@ class Location(object):
         if not self.isEntityPresent(entity):
             self.entities[entity.getID()] = entity
             entity.setLocationID(self.getID())
+            if self.grid != -1:
+                self.grid.notifyEntityAdded(self, entity)
         else:
             print(
                 "Warning: An entity was already present when attempting to add it to a location."
@@ -45,6 +58,8 @@ class Location(object):
     def removeEntity(self, entity: Entity):
         if self.isEntityPresent(entity):
             del self.entities[entity.getID()]
+            if self.grid != -1:
+                self.grid.notifyEntityRemoved(self, entity)
         else:
             print(
                 "Warning: An entity was not present when attempting to remove it from a location."
@@ -1,81 +1,256 @@
-import random
 import time
+from agents.agentRegistry import AGENTS
 from config.config import Config
-from lib.pyenvlib.entity import Entity
-from lib.pyenvlib.environment import Environment
-from food.food import Food
-from lib.pyenvlib.grid import Grid
-from lib.pyenvlib.location import Location
-from snake.snakePart import SnakePart
+from controls.directionQueue import DirectionQueue
+from engine.gameEngine import GameEngine
+from engine.gameSnapshot import GameSnapshot
+from lib.pyenvlib import compactMode
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+from profiling.nullProfiler import NullProfiler
+from profiling.phaseProfiler import PhaseProfiler
+from replay.replay import Replay
+from replay.replayPlayer import ReplayPlayer
+from replay.replayRecorder import ReplayRecorder
+from scheduling.fixedTimestepScheduler import FixedTimestepScheduler
 
 
 # @author Daniel McCoy Stephenson
 # @since August 6th, 2022
 class Ophidian:
-    def __init__(self, useTextUI=False):
+    def __init__(
+        self,
+        useTextUI=False,
+        asyncTextUI=False,
+        boardRenderer=None,
+        ticksPerSecond=None,
+        framesPerSecond=None,
+        profileOutput=None,
+        seed=None,
+        replayOutput=None,
+        saveFile=None,
+        autopilot=None,
+    ):
         self.config = Config()
         self.config.useTextUI = useTextUI
-        
+        self.config.asyncTextUI = asyncTextUI
+        if profileOutput is not None:
+            self.config.profile = True
+            self.config.profileOutput = profileOutput
+        if boardRenderer is not None:
+            self.config.boardRenderer = boardRenderer
+        if ticksPerSecond is not None:
+            self.config.tickSpeed = 1 / ticksPerSecond
+        if framesPerSecond is not None:
+            self.config.framesPerSecond = framesPerSecond
+        if seed is not None:
+            self.config.seed = seed
+        if replayOutput is not None:
+            self.config.replayOutput = replayOutput
+        if saveFile is not None:
+            self.config.saveFile = saveFile
+        if autopilot is not None:
+            self.config.autopilot = autopilot
+        compactMode.setCompactMode(self.config.compactEntities)
+
         # Import pygame and graphik only if not using text UI
         if not self.config.useTextUI:
             import pygame
+
             self.pygame = pygame
             from lib.graphik.src.graphik import Graphik
-            
+
             pygame.init()
             self.initializeGameDisplay()
             pygame.display.set_icon(pygame.image.load("src/media/icon.PNG"))
             self.graphik = Graphik(self.gameDisplay)
+            self.surfaceRenderer = None
+            if self.config.boardRenderer == "surface":
+                from rendering.surfaceRenderer import SurfaceRenderer
+
+                if SurfaceRenderer.isAvailable():
+                    self.surfaceRenderer = SurfaceRenderer(pygame, self.config)
+                else:
+                    print("NumPy is not installed, so the cell renderer will be used.")
         else:
             from textui.textrenderer import TextRenderer
+
             self.pygame = None
             self.textRenderer = TextRenderer(self.config)
-            self.textRenderer.enableRawMode()
-        
+
         self.running = True
-        self.snakeParts = []
-        self.level = 1
-        self.initialize()
-        self.tick = 0
-        self.score = 0
-        self.changedDirectionThisTick = False
-        self.collision = False
+        self.directionQueue = DirectionQueue(self.config.inputQueueSize)
+        self.fullRedrawNeeded = True
+        self.changedLocations = []
+        self.scheduler = FixedTimestepScheduler(
+            1 / self.config.tickSpeed,
+            self.config.framesPerSecond,
+            self.config.maxCatchUpTicks,
+        )
+        self.scheduler.setLimitTicks(self.config.limitTickSpeed)
+        if self.config.profile:
+            self.profiler = PhaseProfiler()
+        else:
+            self.profiler = NullProfiler()
+        self.profilerOverlayLines = []
+        self.profilerOverlayUpdateTime = 0
+        self.engine = GameEngine(self.config)
+        self.engine.setProfiler(self.profiler)
+        self.autopilot = None
+        if self.config.autopilot is not None:
+            self.autopilot = AGENTS[self.config.autopilot](self.engine.getSeed())
+        self.replayRecorder = None
+        if self.config.replayOutput is not None:
+            self.replayRecorder = ReplayRecorder(self.engine)
+        self.startLevel()
+        if saveFile is not None:
+            self.loadGame()
 
     def initializeGameDisplay(self):
         if self.config.useTextUI:
             return  # No display needed for text UI
-        
+
         if self.config.fullscreen:
             self.gameDisplay = self.pygame.display.set_mode(
-                (self.config.displayWidth, self.config.displayHeight), self.pygame.FULLSCREEN
+                (self.config.displayWidth, self.config.displayHeight),
+                self.pygame.FULLSCREEN,
             )
         else:
             self.gameDisplay = self.pygame.display.set_mode(
-                (self.config.displayWidth, self.config.displayHeight), self.pygame.RESIZABLE
+                (self.config.displayWidth, self.config.displayHeight),
+                self.pygame.RESIZABLE,
             )
 
     def initializeLocationWidthAndHeight(self):
         if self.config.useTextUI:
             return  # Not needed for text UI
-        
+
         x, y = self.gameDisplay.get_size()
-        self.locationWidth = x / self.environment.getGrid().getRows()
-        self.locationHeight = y / self.environment.getGrid().getColumns()
+        grid = self.engine.getEnvironment().getGrid()
+        self.locationWidth = x / grid.getRows()
+        self.locationHeight = y / grid.getColumns()
+
+    # Sets up the display for the engine's current level.
+    def startLevel(self):
+        self.initializeLocationWidthAndHeight()
+        self.fullRedrawNeeded = True
+        if not self.config.useTextUI:
+            self.pygame.display.set_caption(
+                "Ophidian - Level " + str(self.engine.getLevel())
+            )
+        self.printMessage("The ophidian enters the world.")
 
     # Draws the environment in its entirety.
     def drawEnvironment(self):
         if self.config.useTextUI:
             return  # Rendering handled separately in text UI
-        
-        for locationId in self.environment.getGrid().getLocations():
-            location = self.environment.getGrid().getLocation(locationId)
-            self.drawLocation(
-                location,
-                location.getX() * self.locationWidth - 1,
-                location.getY() * self.locationHeight - 1,
-                self.locationWidth + 2,
-                self.locationHeight + 2,
+
+        grid = self.engine.getEnvironment().getGrid()
+        if self.surfaceRenderer is not None:
+            self.surfaceRenderer.drawEnvironment(
+                self.gameDisplay, grid, self.engine.hasCollided()
+            )
+            return
+
+        for locationId in grid.getLocations():
+            location = grid.getLocation(locationId)
+            self.drawLocation(location, *self.getLocationRect(location))
+
+    # Returns the pixel rectangle covered by a location. Neighbouring rectangles share edges without overlapping, so a single location can be redrawn on its own.
+    def getLocationRect(self, location):
+        left = int(location.getX() * self.locationWidth)
+        top = int(location.getY() * self.locationHeight)
+        right = int((location.getX() + 1) * self.locationWidth)
+        bottom = int((location.getY() + 1) * self.locationHeight)
+        return left, top, right - left, bottom - top
+
+    # Redraws only the given locations and returns the rectangles that were drawn.
+    def drawChangedLocations(self, locations):
+        rects = []
+        for location in set(locations):
+            rect = self.getLocationRect(location)
+            self.drawLocation(location, *rect)
+            rects.append(rect)
+        return rects
+
+    # Draws the progress bar along the bottom of the display and returns its rectangle.
+    def drawProgressBar(self):
+        x, y = self.gameDisplay.get_size()
+        percentage = self.engine.getProgress()
+        self.pygame.draw.rect(self.gameDisplay, self.config.black, (0, y - 20, x, 20))
+        if percentage < self.config.levelProgressPercentageRequired / 2:
+            self.pygame.draw.rect(
+                self.gameDisplay, self.config.red, (0, y - 20, x * percentage, 20)
+            )
+        elif percentage < self.config.levelProgressPercentageRequired:
+            self.pygame.draw.rect(
+                self.gameDisplay,
+                self.config.yellow,
+                (0, y - 20, x * percentage, 20),
             )
+        else:
+            self.pygame.draw.rect(
+                self.gameDisplay, self.config.green, (0, y - 20, x * percentage, 20)
+            )
+        self.pygame.draw.rect(
+            self.gameDisplay, self.config.black, (0, y - 20, x, 20), 1
+        )
+        return (0, y - 20, x, 20)
+
+    # Draws the profiler's percentiles in the top left corner and returns the rectangle drawn over.
+    def drawProfilerOverlay(self):
+        now = time.perf_counter()
+        if now - self.profilerOverlayUpdateTime >= 0.5:
+            self.profilerOverlayUpdateTime = now
+            self.profilerOverlayLines = ["phase  p50 / p95 / p99 ms"]
+            for phase in self.profiler.getPhases():
+                p50, p95, p99 = self.profiler.getPercentiles(phase)
+                self.profilerOverlayLines.append(
+                    "%s  %.2f / %.2f / %.2f" % (phase, p50, p95, p99)
+                )
+
+        size = 14
+        width = 230
+        height = len(self.profilerOverlayLines) * (size + 2) + 4
+        self.pygame.draw.rect(
+            self.gameDisplay, self.config.black, (0, 0, width, height)
+        )
+        for index, line in enumerate(self.profilerOverlayLines):
+            textSurface = self.graphik.getTextSurface(line, size, self.config.white)
+            self.gameDisplay.blit(textSurface, (4, 2 + index * (size + 2)))
+        return (0, 0, width, height)
+
+    # Draws a frame, redrawing everything only when the whole display is stale.
+    def renderPygameUI(self):
+        changedLocations = self.changedLocations
+        self.changedLocations = []
+        showOverlay = self.profiler.isEnabled() and self.config.profileOverlay
+        if self.fullRedrawNeeded:
+            self.fullRedrawNeeded = False
+            timer = self.profiler.startTimer()
+            self.gameDisplay.fill(self.config.white)
+            self.drawEnvironment()
+            self.drawProgressBar()
+            if showOverlay:
+                self.drawProfilerOverlay()
+            self.profiler.stopTimer("drawEnvironment", timer)
+            timer = self.profiler.startTimer()
+            self.pygame.display.update()
+            self.profiler.stopTimer("displayUpdate", timer)
+            return
+
+        if not changedLocations and not showOverlay:
+            return
+        timer = self.profiler.startTimer()
+        rects = self.drawChangedLocations(changedLocations)
+        # cells along the bottom row can be drawn over the progress bar
+        rects.append(self.drawProgressBar())
+        if showOverlay:
+            rects.append(self.drawProfilerOverlay())
+        self.profiler.stopTimer("drawChangedLocations", timer)
+        timer = self.profiler.startTimer()
+        self.pygame.display.update(rects)
+        self.profiler.stopTimer("displayUpdate", timer)
 
     # Returns the color that a location should be displayed as.
     def getColorOfLocation(self, location):
@@ -83,30 +258,31 @@ class Ophidian:
             color = self.config.white
         else:
             color = self.config.white
-            if location.getNumEntities() > 0:
-                topEntityId = list(location.getEntities().keys())[-1]
-                topEntity = location.getEntity(topEntityId)
+            grid = self.engine.getEnvironment().getGrid()
+            if grid.getCellState(location) != CellState.EMPTY:
+                topEntity = next(reversed(location.getEntities().values()))
                 return topEntity.getColor()
         return color
 
     # Draws a location at a specified position.
     def drawLocation(self, location, xPos, yPos, width, height):
-        if self.collision == True:
+        if self.engine.hasCollided():
             color = self.config.red
         else:
             color = self.getColorOfLocation(location)
         self.graphik.drawRectangle(xPos, yPos, width, height, color)
 
-    def calculateScore(self):
-        length = len(self.snakeParts)
-        numLocations = len(self.environment.grid.getLocations())
-        percentage = int(length / numLocations * 100)
-        self.score = length * percentage
+    # Prints a message for the player. The text UI shows it on its status line
+    # while it is drawing, so that it does not end up on top of the board.
+    def printMessage(self, *values):
+        if self.config.useTextUI:
+            self.textRenderer.showMessage(" ".join(str(value) for value in values))
+        else:
+            print(*values)
 
     def displayStatsInConsole(self):
-        length = len(self.snakeParts)
-        numLocations = len(self.environment.grid.getLocations())
-        percentage = int(length / numLocations * 100)
+        length = len(self.engine.getSnakeBody())
+        percentage = int(self.engine.getProgress() * 100)
         print(
             "The ophidian had a length of",
             length,
@@ -114,364 +290,265 @@ class Ophidian:
             percentage,
             "percent of the world.",
         )
-        print("Score:", self.score)
+        print("Score:", self.engine.getScore())
+        print("Seed:", self.engine.getSeed())
         print("-----")
 
     def checkForLevelProgressAndReinitialize(self):
-        if (
-            len(self.snakeParts)
-            > len(self.environment.grid.getLocations())
-            * self.config.levelProgressPercentageRequired
-        ):
-            self.level += 1
-        self.initialize()
+        if self.replayRecorder is not None:
+            self.replayRecorder.recordRestart()
+        self.engine.checkForLevelProgressAndReinitialize()
+        self.directionQueue.clear()
+        self.startLevel()
+
+    def saveGame(self):
+        try:
+            self.engine.snapshot().save(self.config.saveFile)
+        except OSError as error:
+            self.printMessage("Could not save", self.config.saveFile + ":", error)
+            return
+        self.printMessage("Game saved to", self.config.saveFile)
+
+    def loadGame(self):
+        try:
+            snapshot = GameSnapshot.load(self.config.saveFile)
+        except (OSError, ValueError) as error:
+            self.printMessage("Could not load", self.config.saveFile + ":", error)
+            return
+        if self.replayRecorder is not None:
+            # a replay cannot jump to a saved state, so it ends here
+            self.replayRecorder.finish().save(self.config.replayOutput)
+            self.printMessage(
+                "Replay written to", self.config.replayOutput, "before loading the save"
+            )
+            self.replayRecorder = None
+        self.engine.restore(snapshot)
+        self.directionQueue.clear()
+        self.startLevel()
+        self.scheduler.reset()
 
     def quitApplication(self):
-        self.displayStatsInConsole()
         if self.config.useTextUI:
+            # restore the terminal first so that the stats are printed below the board
             self.textRenderer.disableRawMode()
-        else:
+        self.displayStatsInConsole()
+        if self.profiler.isEnabled():
+            self.profiler.writeSummary(self.config.profileOutput)
+            print("Profile written to", self.config.profileOutput)
+        if self.replayRecorder is not None:
+            self.replayRecorder.finish().save(self.config.replayOutput)
+            print("Replay written to", self.config.replayOutput)
+        if hasattr(self.autopilot, "close"):
+            # stops the worker processes of searching agents
+            self.autopilot.close()
+        if not self.config.useTextUI:
             self.pygame.quit()
         quit()
 
-    def getLocation(self, entity: Entity):
-        locationID = entity.getLocationID()
-        grid = self.environment.getGrid()
-        return grid.getLocation(locationID)
-
-    def getLocationAndGrid(self, entity: Entity):
-        locationID = entity.getLocationID()
-        grid = self.environment.getGrid()
-        return grid, grid.getLocation(locationID)
-
-    def moveEntity(self, entity: Entity, direction):
-        grid, location = self.getLocationAndGrid(entity)
-
-        newLocation = -1
-        # get new location
-        if direction == 0:
-            newLocation = grid.getUp(location)
-        elif direction == 1:
-            newLocation = grid.getLeft(location)
-        elif direction == 2:
-            newLocation = grid.getDown(location)
-        elif direction == 3:
-            newLocation = grid.getRight(location)
-
-        if newLocation == -1:
-            # location doesn't exist, we're at a border
-            return
-
-        # if new location has a snake part already
-        for eid in newLocation.getEntities():
-            e = newLocation.getEntity(eid)
-            if type(e) is SnakePart:
-                # we have a collision
-                self.collision = True
-                print("The ophidian collides with itself and ceases to be.")
-                if not self.config.useTextUI:
-                    self.drawEnvironment()
-                    self.pygame.display.update()
-                time.sleep(self.config.tickSpeed * 20)
-                if self.config.restartUponCollision:
-                    self.checkForLevelProgressAndReinitialize()
-                else:
-                    self.running = False
-                return
-
-        # move entity
-        location.removeEntity(entity)
-        newLocation.addEntity(entity)
-        entity.lastPosition = location
-
-        # move all attached snake parts
-        if entity.hasPrevious():
-            self.movePreviousSnakePart(entity)
-
-        if self.config.debug:
-            print(
+    # Advances the engine by one tick, applying the next queued direction change.
+    # A collision is handled here unless handleCollision is False, in which case the caller handles it.
+    def stepEngine(self, handleCollision=True):
+        pressTime = -1
+        if self.autopilot is not None:
+            direction = self.autopilot.chooseDirection(self.engine)
+        else:
+            direction, pressTime = self.directionQueue.pop()
+        if self.replayRecorder is not None:
+            self.replayRecorder.recordStep(direction)
+        result = self.engine.step(direction)
+        if pressTime != -1:
+            # time from the key press to the tick that turned the ophidian
+            self.profiler.record("inputLatency", time.perf_counter_ns() - pressTime)
+
+        if result.hasCollided():
+            if handleCollision:
+                self.handleCollision()
+            return None
+        self.changedLocations.extend(result.getChangedLocations())
+        if result.isBoardFull():
+            self.printMessage("There is no room left in the world for food.")
+
+        if self.config.debug and result.hasMoved():
+            location = self.engine.getLocation(self.engine.getSelectedSnakePart())
+            self.printMessage(
                 "[EVENT] ",
-                entity.getName(),
+                self.engine.getSelectedSnakePart().getName(),
                 "moved to (",
                 location.getX(),
                 ",",
                 location.getY(),
                 ")",
             )
+        return result
+
+    # Steps the engine once for each due tick, stopping at a collision. The
+    # collision is handled after the ticks are timed, so that its pause is not
+    # counted as time spent on ticks.
+    def runTicks(self, dueTicks):
+        timer = self.profiler.startTimer()
+        collided = False
+        for _ in range(dueTicks):
+            if self.stepEngine(handleCollision=False) is None:
+                collided = True
+                break
+        self.profiler.stopTimer("ticks", timer)
+        if collided:
+            self.handleCollision()
 
-        food = -1
-        # check for food
-        for eid in newLocation.getEntities():
-            e = newLocation.getEntity(eid)
-            if type(e) is Food:
-                food = e
-
-        if food == -1:
-            return
-
-        foodColor = food.getColor()
-
-        self.removeEntity(food)
-        self.spawnFood()
-        self.spawnSnakePart(entity.getTail(), foodColor)
-        self.calculateScore()
-
-    def movePreviousSnakePart(self, snakePart):
-        previousSnakePart = snakePart.previousSnakePart
-
-        previousSnakePartLocation = self.getLocation(previousSnakePart)
-
-        if previousSnakePartLocation == -1:
-            print("Error: A previous snake part's location was unexpectantly -1.")
-            time.sleep(1)
-            self.quitApplication()
-
-        targetLocation = snakePart.lastPosition
-
-        # move entity
-        previousSnakePartLocation.removeEntity(previousSnakePart)
-        targetLocation.addEntity(previousSnakePart)
-        previousSnakePart.lastPosition = previousSnakePartLocation
+    def handleCollision(self):
+        self.showCollision()
+        time.sleep(self.getCollisionPause())
+        self.finishCollision()
 
-        if previousSnakePart.hasPrevious():
-            self.movePreviousSnakePart(previousSnakePart)
+    def showCollision(self):
+        self.printMessage("The ophidian collides with itself and ceases to be.")
+        if self.config.useTextUI:
+            self.renderTextUI()
+        else:
+            self.drawEnvironment()
+            self.pygame.display.update()
+            self.fullRedrawNeeded = True
 
-    def removeEntityFromLocation(self, entity: Entity):
-        location = self.getLocation(entity)
-        if location.isEntityPresent(entity):
-            location.removeEntity(entity)
+    # Returns how many seconds the collision stays on screen.
+    def getCollisionPause(self):
+        return self.config.tickSpeed * 20
 
-    def removeEntity(self, entity: Entity):
-        self.removeEntityFromLocation(entity)
+    # Restarts or stops the game after the collision has been shown.
+    def finishCollision(self):
+        if self.config.restartUponCollision:
+            self.checkForLevelProgressAndReinitialize()
+        else:
+            self.running = False
+        self.scheduler.reset()
+
+    def changeDirection(self, direction):
+        self.directionQueue.push(
+            direction,
+            self.engine.getSelectedSnakePart().getDirection(),
+            time.perf_counter_ns(),
+        )
 
     def handleKeyDownEvent(self, key):
         # For text UI, key is a character; for pygame, it's a key code
         if self.config.useTextUI:
             # Text UI key handling
-            if key == 'q':
+            if key == "q":
                 self.running = False
-            elif key == 'w' or key == '\x1b[A':  # w or up arrow
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 2
-                ):
-                    self.selectedSnakePart.setDirection(0)
-                    self.changedDirectionThisTick = True
-            elif key == 'a' or key == '\x1b[D':  # a or left arrow
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 3
-                ):
-                    self.selectedSnakePart.setDirection(1)
-                    self.changedDirectionThisTick = True
-            elif key == 's' or key == '\x1b[B':  # s or down arrow
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 0
-                ):
-                    self.selectedSnakePart.setDirection(2)
-                    self.changedDirectionThisTick = True
-            elif key == 'd' or key == '\x1b[C':  # d or right arrow
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 1
-                ):
-                    self.selectedSnakePart.setDirection(3)
-                    self.changedDirectionThisTick = True
-            elif key == 'r':
+            elif key == "w" or key == "\x1b[A":  # w or up arrow
+                self.changeDirection(Direction.UP)
+            elif key == "a" or key == "\x1b[D":  # a or left arrow
+                self.changeDirection(Direction.LEFT)
+            elif key == "s" or key == "\x1b[B":  # s or down arrow
+                self.changeDirection(Direction.DOWN)
+            elif key == "d" or key == "\x1b[C":  # d or right arrow
+                self.changeDirection(Direction.RIGHT)
+            elif key == "r":
                 self.checkForLevelProgressAndReinitialize()
                 return "restart"
+            elif key == "o":
+                self.saveGame()
+            elif key == "p":
+                self.loadGame()
+                return "restart"
         else:
             # Pygame key handling
             if key == self.pygame.K_q:
                 self.running = False
             elif key == self.pygame.K_w or key == self.pygame.K_UP:
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 2
-                ):
-                    self.selectedSnakePart.setDirection(0)
-                    self.changedDirectionThisTick = True
+                self.changeDirection(Direction.UP)
             elif key == self.pygame.K_a or key == self.pygame.K_LEFT:
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 3
-                ):
-                    self.selectedSnakePart.setDirection(1)
-                    self.changedDirectionThisTick = True
+                self.changeDirection(Direction.LEFT)
             elif key == self.pygame.K_s or key == self.pygame.K_DOWN:
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 0
-                ):
-                    self.selectedSnakePart.setDirection(2)
-                    self.changedDirectionThisTick = True
+                self.changeDirection(Direction.DOWN)
             elif key == self.pygame.K_d or key == self.pygame.K_RIGHT:
-                if (
-                    self.changedDirectionThisTick == False
-                    and self.selectedSnakePart.getDirection() != 1
-                ):
-                    self.selectedSnakePart.setDirection(3)
-                    self.changedDirectionThisTick = True
+                self.changeDirection(Direction.RIGHT)
             elif key == self.pygame.K_F11:
                 if self.config.fullscreen:
                     self.config.fullscreen = False
                 else:
                     self.config.fullscreen = True
                 self.initializeGameDisplay()
+                self.initializeLocationWidthAndHeight()
+                self.fullRedrawNeeded = True
             elif key == self.pygame.K_l:
                 if self.config.limitTickSpeed:
                     self.config.limitTickSpeed = False
                 else:
                     self.config.limitTickSpeed = True
+                self.scheduler.setLimitTicks(self.config.limitTickSpeed)
             elif key == self.pygame.K_r:
                 self.checkForLevelProgressAndReinitialize()
                 return "restart"
-
-    def getRandomDirection(self, grid: Grid, location: Location):
-        direction = random.randrange(0, 4)
-        if direction == 0:
-            return grid.getUp(location)
-        elif direction == 1:
-            return grid.getRight(location)
-        elif direction == 2:
-            return grid.getDown(location)
-        elif direction == 3:
-            return grid.getLeft(location)
-
-    def getLocationDirection(self, direction, grid, location):
-        if direction == 0:
-            return grid.getUp(location)
-        elif direction == 1:
-            return grid.getLeft(location)
-        elif direction == 2:
-            return grid.getDown(location)
-        elif direction == 3:
-            return grid.getRight(location)
-
-    def getLocationOppositeDirection(self, direction, grid, location):
-        if direction == 0:
-            return grid.getDown(location)
-        elif direction == 1:
-            return grid.getRight(location)
-        elif direction == 2:
-            return grid.getUp(location)
-        elif direction == 3:
-            return grid.getLeft(location)
-
-    def spawnSnakePart(self, snakePart: SnakePart, color):
-        newSnakePart = SnakePart(color)
-        snakePart.setPrevious(newSnakePart)
-        newSnakePart.setNext(snakePart)
-        grid, location = self.getLocationAndGrid(snakePart)
-
-        targetLocation = -1
-        while True:
-            targetLocation = self.getRandomDirection(grid, location)
-            if targetLocation != -1 and targetLocation != self.getLocationDirection(
-                snakePart.getDirection(), grid, location
-            ):
-                break
-
-        self.environment.addEntityToLocation(newSnakePart, targetLocation)
-        self.snakeParts.append(newSnakePart)
-
-    def spawnFood(self):
-        food = Food(
-            (
-                random.randrange(50, 200),
-                random.randrange(50, 200),
-                random.randrange(50, 200),
-            )
-        )
-
-        # get target location
-        targetLocation = -1
-        notFound = True
-        while notFound:
-            targetLocation = self.environment.getGrid().getRandomLocation()
-            if targetLocation.getNumEntities() == 0:
-                notFound = False
-
-        self.environment.addEntity(food)
-
-    def initialize(self):
-        self.collision = False
-        self.score = 0
-        self.snakeParts = []
-        self.tick = 0
-        if self.level == 1:
-            self.environment = Environment(
-                "Level " + str(self.level), self.config.gridSize
-            )
-        else:
-            self.environment = Environment(
-                "Level " + str(self.level), self.config.gridSize + (self.level - 1) * 2
-            )
-        self.initializeLocationWidthAndHeight()
-        if not self.config.useTextUI:
-            self.pygame.display.set_caption("Ophidian - Level " + str(self.level))
-        self.selectedSnakePart = SnakePart(
-            (
-                random.randrange(50, 200),
-                random.randrange(50, 200),
-                random.randrange(50, 200),
-            )
-        )
-        self.environment.addEntity(self.selectedSnakePart)
-        self.snakeParts.append(self.selectedSnakePart)
-        print("The ophidian enters the world.")
-        self.spawnFood()
+            elif key == self.pygame.K_o:
+                self.saveGame()
+            elif key == self.pygame.K_p:
+                self.loadGame()
+                return "restart"
 
     def run(self):
-        if self.config.useTextUI:
+        if self.config.useTextUI and self.config.asyncTextUI:
+            from textui.asyncTextRunner import AsyncTextRunner
+
+            AsyncTextRunner(self).run()
+            self.quitApplication()
+        elif self.config.useTextUI:
             self.runTextUI()
         else:
             self.runPygameUI()
 
+    def renderTextUI(self):
+        snakeBody = self.engine.getSnakeBody()
+        self.textRenderer.renderGrid(
+            self.engine.getEnvironment(), snakeBody, self.engine.hasCollided()
+        )
+        self.textRenderer.renderStats(
+            self.engine.getLevel(),
+            len(snakeBody),
+            self.engine.getScore(),
+            self.engine.getProgress(),
+        )
+        self.textRenderer.renderControls()
+        self.textRenderer.flush()
+
     def runTextUI(self):
         """Run the game with text-based UI"""
-        while self.running:
-            # Check for key press (non-blocking)
-            key = self.textRenderer.getKeyPress(timeout=0)
-            if key:
-                result = self.handleKeyDownEvent(key)
-                if result == "restart":
-                    continue
-
-            # Move snake based on direction
-            if self.selectedSnakePart.getDirection() == 0:
-                self.moveEntity(self.selectedSnakePart, 0)
-            elif self.selectedSnakePart.getDirection() == 1:
-                self.moveEntity(self.selectedSnakePart, 1)
-            elif self.selectedSnakePart.getDirection() == 2:
-                self.moveEntity(self.selectedSnakePart, 2)
-            elif self.selectedSnakePart.getDirection() == 3:
-                self.moveEntity(self.selectedSnakePart, 3)
-
-            # Render the game state
-            percentage = len(self.snakeParts) / len(
-                self.environment.grid.getLocations()
-            )
-            self.textRenderer.renderGrid(
-                self.environment, self.snakeParts, self.collision
-            )
-            self.textRenderer.renderStats(
-                self.level, len(self.snakeParts), self.score, percentage
-            )
-            self.textRenderer.renderControls()
+        self.textRenderer.enableRawMode()
+        self.scheduler.reset()
+        try:
+            while self.running:
+                # Wait for a key press until the next tick or frame is due
+                key = self.textRenderer.getKeyPress(
+                    timeout=self.scheduler.getTimeUntilNextDeadline()
+                )
+                if key:
+                    result = self.handleKeyDownEvent(key)
+                    if result == "restart":
+                        continue
 
-            if self.config.limitTickSpeed:
-                time.sleep(self.config.tickSpeed)
-                self.tick += 1
-                self.changedDirectionThisTick = False
+                # Move snake based on direction
+                dueTicks = self.scheduler.getDueTicks()
+                if dueTicks > 0:
+                    self.runTicks(dueTicks)
+
+                # Render the game state
+                if self.scheduler.isFrameDue():
+                    timer = self.profiler.startTimer()
+                    self.renderTextUI()
+                    self.profiler.stopTimer("renderTextUI", timer)
+        finally:
+            # put the terminal back even after Ctrl-C or an error
+            self.textRenderer.disableRawMode()
 
         self.quitApplication()
 
     def runPygameUI(self):
         """Run the game with pygame graphical UI"""
+        self.scheduler.reset()
         while self.running:
-            for event in self.pygame.event.get():
+            timer = self.profiler.startTimer()
+            events = self.pygame.event.get()
+            self.profiler.stopTimer("eventPolling", timer)
+            for event in events:
                 if event.type == self.pygame.QUIT:
                     self.quitApplication()
                 elif event.type == self.pygame.KEYDOWN:
@@ -480,58 +557,128 @@ class Ophidian:
                         continue
                 elif event.type == self.pygame.WINDOWRESIZED:
                     self.initializeLocationWidthAndHeight()
+                    self.fullRedrawNeeded = True
 
-            if self.selectedSnakePart.getDirection() == 0:
-                self.moveEntity(self.selectedSnakePart, 0)
-            elif self.selectedSnakePart.getDirection() == 1:
-                self.moveEntity(self.selectedSnakePart, 1)
-            elif self.selectedSnakePart.getDirection() == 2:
-                self.moveEntity(self.selectedSnakePart, 2)
-            elif self.selectedSnakePart.getDirection() == 3:
-                self.moveEntity(self.selectedSnakePart, 3)
+            dueTicks = self.scheduler.getDueTicks()
+            if dueTicks > 0:
+                self.runTicks(dueTicks)
 
-            self.gameDisplay.fill(self.config.white)
-            self.drawEnvironment()
-            x, y = self.gameDisplay.get_size()
+            if self.scheduler.isFrameDue():
+                self.renderPygameUI()
 
-            # draw progress bar
-            percentage = len(self.snakeParts) / len(
-                self.environment.grid.getLocations()
-            )
-            self.pygame.draw.rect(self.gameDisplay, self.config.black, (0, y - 20, x, 20))
-            if percentage < self.config.levelProgressPercentageRequired / 2:
-                self.pygame.draw.rect(
-                    self.gameDisplay, self.config.red, (0, y - 20, x * percentage, 20)
-                )
-            elif percentage < self.config.levelProgressPercentageRequired:
-                self.pygame.draw.rect(
-                    self.gameDisplay,
-                    self.config.yellow,
-                    (0, y - 20, x * percentage, 20),
-                )
-            else:
-                self.pygame.draw.rect(
-                    self.gameDisplay, self.config.green, (0, y - 20, x * percentage, 20)
-                )
-            self.pygame.draw.rect(self.gameDisplay, self.config.black, (0, y - 20, x, 20), 1)
+            self.scheduler.wait()
 
-            self.pygame.display.update()
+        self.quitApplication()
 
-            if self.config.limitTickSpeed:
-                time.sleep(self.config.tickSpeed)
-                self.tick += 1
-                self.changedDirectionThisTick = False
 
-        self.quitApplication()
+# Plays a recorded game headless at full speed, printing the chosen frames as text.
+def playReplay(path, frames=None):
+    from textui.textrenderer import TextRenderer
+
+    replay = Replay.load(path)
+    player = ReplayPlayer(replay)
+    renderer = TextRenderer(player.getEngine().config)
+
+    def printFrame(engine, tick):
+        print("Tick", tick, "- level", engine.getLevel(), "- score", engine.getScore())
+        print(renderer.formatGrid(engine.getEnvironment(), engine.getSnakeBody()))
+
+    start = time.perf_counter()
+    engine = player.play(frames, printFrame)
+    elapsed = time.perf_counter() - start
+    print(
+        "Played",
+        player.getTicks(),
+        "ticks in",
+        round(elapsed, 3),
+        "seconds. Level:",
+        engine.getLevel(),
+        "Length:",
+        len(engine.getSnakeBody()),
+        "Score:",
+        engine.getScore(),
+    )
 
 
 import argparse
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Ophidian - A snake game')
-    parser.add_argument('--text-ui', action='store_true', 
-                        help='Use text-based UI instead of graphical UI')
+    parser = argparse.ArgumentParser(description="Ophidian - A snake game")
+    parser.add_argument(
+        "--text-ui",
+        action="store_true",
+        help="Use text-based UI instead of graphical UI",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_text_ui",
+        action="store_true",
+        help="Run the text-based UI on an asyncio event loop",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=["cells", "surface"],
+        help="How the graphical UI draws the whole board (surface requires numpy)",
+    )
+    parser.add_argument("--tps", type=float, help="Target simulation ticks per second")
+    parser.add_argument("--fps", type=float, help="Target frames per second")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profile.json",
+        metavar="PATH",
+        help="Time each phase of the game loop and write a summary "
+        "to PATH on quit (.csv for CSV, JSON otherwise)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for food placement and colors, to play the same game again",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="Record the game to a replay file at PATH on quit",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="Play back a replay file headless at full speed",
+    )
+    parser.add_argument(
+        "--replay-frames",
+        metavar="TICKS",
+        help="Comma-separated ticks to print while playing back a replay",
+    )
+    parser.add_argument(
+        "--load",
+        metavar="PATH",
+        help="Start from a saved game. Saving (o) and loading (p) then use PATH",
+    )
+    parser.add_argument(
+        "--autopilot",
+        choices=sorted(AGENTS),
+        help="Let an agent steer instead of the keyboard",
+    )
     args = parser.parse_args()
-    
-    ophidian = Ophidian(useTextUI=args.text_ui)
+
+    if args.replay:
+        frames = None
+        if args.replay_frames:
+            frames = [int(tick) for tick in args.replay_frames.split(",")]
+        playReplay(args.replay, frames)
+        quit()
+
+    ophidian = Ophidian(
+        useTextUI=args.text_ui,
+        asyncTextUI=args.async_text_ui,
+        boardRenderer=args.renderer,
+        ticksPerSecond=args.tps,
+        framesPerSecond=args.fps,
+        profileOutput=args.profile,
+        seed=args.seed,
+        replayOutput=args.record,
+        saveFile=args.load,
+        autopilot=args.autopilot,
+    )
     ophidian.run()
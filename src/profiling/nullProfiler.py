@@ -0,0 +1,23 @@
+# @author agent
+# @since October 17th, 2026
+#
+# Stands in for PhaseProfiler when profiling is off, so instrumented code
+# costs only a few no-op calls.
+class NullProfiler:
+    def isEnabled(self):
+        return False
+
+    def startTimer(self):
+        return 0
+
+    def stopTimer(self, phase, startTime):
+        pass
+
+    def record(self, phase, nanoseconds):
+        pass
+
+    def getPhases(self):
+        return []
+
+    def getSummary(self):
+        return {}
@@ -0,0 +1,79 @@
+import csv
+import json
+import time
+from collections import deque
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Times the phases of the game loop. Each phase keeps a rolling window of its
+# most recent durations for percentiles, plus a count and total for the whole run.
+class PhaseProfiler:
+    def __init__(self, windowSize=1000):
+        self.windowSize = windowSize
+        self.samples = {}
+        self.counts = {}
+        self.totals = {}
+
+    def isEnabled(self):
+        return True
+
+    # Returns a start time to be passed to stopTimer.
+    def startTimer(self):
+        return time.perf_counter_ns()
+
+    # Records the time elapsed since startTime against a phase.
+    def stopTimer(self, phase, startTime):
+        self.record(phase, time.perf_counter_ns() - startTime)
+
+    # Records a duration in nanoseconds against a phase.
+    def record(self, phase, nanoseconds):
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = deque(maxlen=self.windowSize)
+            self.samples[phase] = samples
+            self.counts[phase] = 0
+            self.totals[phase] = 0
+        samples.append(nanoseconds)
+        self.counts[phase] += 1
+        self.totals[phase] += nanoseconds
+
+    def getPhases(self):
+        return list(self.samples)
+
+    # Returns the 50th, 95th and 99th percentile of a phase's recent durations, in milliseconds.
+    def getPercentiles(self, phase):
+        ordered = sorted(self.samples[phase])
+        last = len(ordered) - 1
+        return tuple(
+            ordered[round(last * fraction)] / 1e6 for fraction in (0.5, 0.95, 0.99)
+        )
+
+    # Returns statistics for every phase, with durations in milliseconds.
+    def getSummary(self):
+        summary = {}
+        for phase in self.samples:
+            p50, p95, p99 = self.getPercentiles(phase)
+            summary[phase] = {
+                "count": self.counts[phase],
+                "meanMs": self.totals[phase] / self.counts[phase] / 1e6,
+                "p50Ms": p50,
+                "p95Ms": p95,
+                "p99Ms": p99,
+                "maxMs": max(self.samples[phase]) / 1e6,
+            }
+        return summary
+
+    # Writes the summary to a file, as CSV if the path ends in .csv and as JSON otherwise.
+    def writeSummary(self, path):
+        summary = self.getSummary()
+        with open(path, "w", newline="") as file:
+            if path.lower().endswith(".csv"):
+                fields = ["count", "meanMs", "p50Ms", "p95Ms", "p99Ms", "maxMs"]
+                writer = csv.writer(file)
+                writer.writerow(["phase"] + fields)
+                for phase, stats in summary.items():
+                    writer.writerow([phase] + [stats[field] for field in fields])
+            else:
+                json.dump(summary, file, indent=2)
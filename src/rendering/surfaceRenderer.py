@@ -0,0 +1,51 @@
+# Optional dependency, only needed for this renderer
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Draws the whole board in one blit. The colour of every location is written
+# into a small RGB array with one pixel per location, which is turned into a
+# surface, scaled up to the size of the display and blitted, instead of drawing
+# one rectangle per location. Only occupied locations are visited in Python.
+class SurfaceRenderer:
+    def __init__(self, pygame, config):
+        self.pygame = pygame
+        self.config = config
+        self.pixels = None
+
+    # Returns whether NumPy is installed, which this renderer requires.
+    @staticmethod
+    def isAvailable():
+        return numpy is not None
+
+    # Returns the RGB array for the grid, reusing the previous one if the size is unchanged.
+    def getPixels(self, grid):
+        shape = (grid.getColumns(), grid.getRows(), 3)
+        if self.pixels is None or self.pixels.shape != shape:
+            self.pixels = numpy.empty(shape, dtype=numpy.uint8)
+        return self.pixels
+
+    # Fills the RGB array with the colour of the top entity in each location.
+    def drawGrid(self, grid, collision):
+        pixels = self.getPixels(grid)
+        if collision:
+            pixels[:] = self.config.red
+            return pixels
+
+        pixels[:] = self.config.white
+        for location in grid.getEntityLocations().values():
+            topEntity = next(reversed(location.getEntities().values()))
+            pixels[location.getX(), location.getY()] = topEntity.getColor()
+        return pixels
+
+    # Draws the grid over the entire display surface.
+    def drawEnvironment(self, display, grid, collision):
+        pixels = self.drawGrid(grid, collision)
+        surface = self.pygame.surfarray.make_surface(pixels)
+        scaled = self.pygame.transform.scale(surface, display.get_size())
+        display.blit(scaled, (0, 0))
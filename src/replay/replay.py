@@ -0,0 +1,103 @@
+import json
+import struct
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# A recorded game. The file starts with a short header holding the seed and the
+# config values that affect the rules. The rest is a stream of events. Each
+# event is one unsigned LEB128 varint holding (idle ticks << 3) | code, where
+# idle ticks is the number of ticks without input before the event. Codes 0-3
+# are ticks with a direction change (the Direction value). RESTART starts the
+# level again and END marks the end of the game.
+class Replay:
+    MAGIC = b"OPHR"
+    VERSION = 2
+    RESTART = 4
+    END = 5
+
+    # the config values that decide how a game plays out
+    CONFIG_FIELDS = (
+        "gridSize",
+        "levelGrowth",
+        "maxGridSize",
+        "wrapAroundEdges",
+        "levelProgressPercentageRequired",
+        "restartUponCollision",
+    )
+
+    def __init__(self, seed, config, events=None):
+        self.seed = seed
+        self.config = config
+        self.events = bytearray() if events is None else events
+
+    def getSeed(self):
+        return self.seed
+
+    # Returns the recorded config values as a dict.
+    def getConfig(self):
+        return self.config
+
+    def getEvents(self):
+        return self.events
+
+    # Applies the recorded config values to a Config.
+    def applyConfig(self, config):
+        for field, value in self.config.items():
+            setattr(config, field, value)
+
+    # Appends an event that follows the given number of ticks without input.
+    def addEvent(self, idleTicks, code):
+        value = (idleTicks << 3) | code
+        while value > 0x7F:
+            self.events.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.events.append(value)
+
+    # Yields (idle ticks, code) for each event in order.
+    def iterateEvents(self):
+        events = self.events
+        value = 0
+        shift = 0
+        for byte in events:
+            value |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            yield value >> 3, value & 0x7
+            value = 0
+            shift = 0
+
+    def toBytes(self):
+        header = json.dumps(
+            {"seed": self.seed, "config": self.config}, separators=(",", ":")
+        ).encode()
+        return (
+            self.MAGIC
+            + struct.pack("<BI", self.VERSION, len(header))
+            + header
+            + bytes(self.events)
+        )
+
+    @staticmethod
+    def fromBytes(data):
+        if data[:4] != Replay.MAGIC:
+            raise ValueError("not an ophidian replay")
+        version, headerLength = struct.unpack_from("<BI", data, 4)
+        if version != Replay.VERSION:
+            raise ValueError("unsupported replay version " + str(version))
+        start = 4 + struct.calcsize("<BI")
+        header = json.loads(data[start : start + headerLength])
+        return Replay(
+            header["seed"], header["config"], bytearray(data[start + headerLength :])
+        )
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.toBytes())
+
+    @staticmethod
+    def load(path):
+        with open(path, "rb") as file:
+            return Replay.fromBytes(file.read())
@@ -0,0 +1,56 @@
+from config.config import Config
+from engine.gameEngine import GameEngine
+from lib.pyenvlib.direction import Direction
+from replay.replay import Replay
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Plays a replay back through a headless GameEngine as fast as possible.
+class ReplayPlayer:
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        config = Config()
+        replay.applyConfig(config)
+        self.engine = GameEngine(config, replay.getSeed())
+        self.ticks = 0
+
+    def getEngine(self):
+        return self.engine
+
+    # Returns the number of ticks played so far, counted across restarts.
+    def getTicks(self):
+        return self.ticks
+
+    # Plays the whole replay and returns the engine in its final state.
+    # If frames is given, onFrame(engine, tick) is called after each of those ticks.
+    def play(self, frames=None, onFrame=None):
+        engine = self.engine
+        step = engine.step
+        directions = tuple(Direction)
+        if frames is not None:
+            frames = set(frames)
+
+        for idleTicks, code in self.replay.iterateEvents():
+            if frames is None:
+                for _ in range(idleTicks):
+                    step()
+                self.ticks += idleTicks
+            else:
+                for _ in range(idleTicks):
+                    step()
+                    self.ticks += 1
+                    if self.ticks in frames:
+                        onFrame(engine, self.ticks)
+
+            if code == Replay.END:
+                break
+            if code == Replay.RESTART:
+                engine.checkForLevelProgressAndReinitialize()
+                continue
+            step(directions[code])
+            self.ticks += 1
+            if frames is not None and self.ticks in frames:
+                onFrame(engine, self.ticks)
+        return engine
@@ -0,0 +1,37 @@
+from replay.replay import Replay
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Records the inputs given to a GameEngine so that the game can be played back.
+# Ticks without input are not stored individually, only counted.
+class ReplayRecorder:
+    def __init__(self, engine):
+        config = {
+            field: getattr(engine.config, field) for field in Replay.CONFIG_FIELDS
+        }
+        self.replay = Replay(engine.getSeed(), config)
+        self.idleTicks = 0
+        self.finished = False
+
+    # Records one tick, with the direction passed to GameEngine.step or None.
+    def recordStep(self, direction):
+        if direction is None:
+            self.idleTicks += 1
+            return
+        self.replay.addEvent(self.idleTicks, int(direction))
+        self.idleTicks = 0
+
+    # Records a call to GameEngine.checkForLevelProgressAndReinitialize.
+    def recordRestart(self):
+        self.replay.addEvent(self.idleTicks, Replay.RESTART)
+        self.idleTicks = 0
+
+    # Ends the recording and returns the replay.
+    def finish(self):
+        if not self.finished:
+            self.replay.addEvent(self.idleTicks, Replay.END)
+            self.idleTicks = 0
+            self.finished = True
+        return self.replay
@@ -0,0 +1,93 @@
+import time
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Paces a game loop with a fixed simulation step and a separate frame rate.
+# Deadlines are kept on an absolute perf_counter timeline, so the time spent
+# updating and rendering does not stretch the tick period. When the loop falls
+# behind it runs several ticks in a row to catch up, up to a limit, after which
+# the backlog is dropped. Between deadlines it sleeps instead of spinning.
+class FixedTimestepScheduler:
+    def __init__(
+        self,
+        ticksPerSecond,
+        framesPerSecond,
+        maxCatchUpTicks=5,
+        clock=time.perf_counter,
+        sleep=time.sleep,
+    ):
+        self.clock = clock
+        self.sleep = sleep
+        self.maxCatchUpTicks = maxCatchUpTicks
+        self.limitTicks = True
+        self.setTicksPerSecond(ticksPerSecond)
+        self.setFramesPerSecond(framesPerSecond)
+        self.reset()
+
+    def setTicksPerSecond(self, ticksPerSecond):
+        self.tickInterval = 1 / ticksPerSecond
+
+    def setFramesPerSecond(self, framesPerSecond):
+        self.frameInterval = 1 / framesPerSecond
+
+    # Sets whether ticks are paced. When they are not, a tick is due on every pass of the loop.
+    def setLimitTicks(self, limitTicks):
+        self.limitTicks = limitTicks
+        self.reset()
+
+    # Starts the timeline again from now, for example after the loop was paused.
+    def reset(self):
+        now = self.clock()
+        self.nextTickTime = now + self.tickInterval
+        self.nextFrameTime = now
+
+    # Returns how many ticks should be simulated now and moves the tick deadline past them.
+    def getDueTicks(self):
+        if not self.limitTicks:
+            return 1
+
+        now = self.clock()
+        dueTicks = 0
+        while now >= self.nextTickTime and dueTicks < self.maxCatchUpTicks:
+            dueTicks += 1
+            self.nextTickTime += self.tickInterval
+        if now >= self.nextTickTime:
+            # too far behind to catch up, so skip the rest of the backlog
+            self.nextTickTime = now + self.tickInterval
+        return dueTicks
+
+    # Returns whether a frame should be rendered now, moving the frame deadline forward if so.
+    def isFrameDue(self):
+        now = self.clock()
+        if now < self.nextFrameTime:
+            return False
+        self.nextFrameTime += self.frameInterval
+        if self.nextFrameTime <= now:
+            # missed frames are dropped rather than rendered back to back
+            self.nextFrameTime = now + self.frameInterval
+        return True
+
+    # Returns the number of seconds until the next tick or frame is due.
+    def getTimeUntilNextDeadline(self):
+        if not self.limitTicks:
+            return 0
+        deadline = min(self.nextTickTime, self.nextFrameTime)
+        return max(0, deadline - self.clock())
+
+    # Returns the number of seconds until the next tick is due.
+    def getTimeUntilNextTick(self):
+        if not self.limitTicks:
+            return 0
+        return max(0, self.nextTickTime - self.clock())
+
+    # Returns the number of seconds until the next frame is due.
+    def getTimeUntilNextFrame(self):
+        return max(0, self.nextFrameTime - self.clock())
+
+    # Sleeps until the next tick or frame is due.
+    def wait(self):
+        remaining = self.getTimeUntilNextDeadline()
+        if remaining > 0:
+            self.sleep(remaining)
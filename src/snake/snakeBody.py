@@ -0,0 +1,58 @@
+from collections import deque
+from snake.snakePart import SnakePart
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Holds the parts of an ophidian in order from head to tail.
+class SnakeBody:
+    def __init__(self, head: SnakePart):
+        self.parts = deque([head])
+        head.setBody(self)
+
+    def __len__(self):
+        return len(self.parts)
+
+    def __iter__(self):
+        return iter(self.parts)
+
+    def __getitem__(self, index):
+        return self.parts[index]
+
+    def getHead(self):
+        return self.parts[0]
+
+    def getTail(self):
+        return self.parts[-1]
+
+    def getLength(self):
+        return len(self.parts)
+
+    # Attaches a new part behind the current tail.
+    def append(self, snakePart: SnakePart):
+        tail = self.parts[-1]
+        tail.setPrevious(snakePart)
+        snakePart.setNext(tail)
+        snakePart.setBody(self)
+        self.parts.append(snakePart)
+
+    # Moves the tail part to directly behind the head, which is how the body
+    # follows the head without shifting every part. Returns the moved part, or
+    # -1 if the body is only a head.
+    def advance(self):
+        if len(self.parts) < 2:
+            return -1
+        tail = self.parts.pop()
+        head = self.parts.popleft()
+        if self.parts:
+            neck = head.previousSnakePart
+            newTail = self.parts[-1]
+            newTail.setPrevious(-1)
+            tail.setNext(head)
+            tail.setPrevious(neck)
+            neck.setNext(tail)
+            head.setPrevious(tail)
+        self.parts.appendleft(tail)
+        self.parts.appendleft(head)
+        return tail
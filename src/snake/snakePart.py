@@ -1,16 +1,30 @@
+from lib.pyenvlib.direction import Direction
+from lib.pyenvlib.cellState import CellState
 from lib.pyenvlib.entity import Entity
 
 
 # @author Daniel McCoy Stephenson
 # @since August 6th, 2022
 class SnakePart(Entity):
+    cellState = CellState.SNAKE
+
+    __slots__ = (
+        "color",
+        "direction",
+        "nextSnakePart",
+        "previousSnakePart",
+        "lastPosition",
+        "body",
+    )
+
     def __init__(self, color):
         Entity.__init__(self, "Snake Part")
         self.color = color
-        self.direction = 0
+        self.direction = Direction.UP
         self.nextSnakePart = -1
         self.previousSnakePart = -1
         self.lastPosition = -1
+        self.body = -1
 
     def getDirection(self):
         return self.direction
@@ -24,6 +38,9 @@ class SnakePart(Entity):
     def setPrevious(self, snakePart):
         self.previousSnakePart = snakePart
 
+    def setBody(self, body):
+        self.body = body
+
     def setLastPosition(self, position):
         self.lastPosition = position
 
@@ -34,6 +51,8 @@ class SnakePart(Entity):
         return self.previousSnakePart != -1
 
     def getTail(self):
+        if self.body != -1:
+            return self.body.getTail()
         if self.previousSnakePart == -1:
             return self
         temp = self.previousSnakePart
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import sys
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Runs the text UI on an asyncio event loop instead of a polling loop. Stdin is
+# registered with the loop, so key presses are queued as soon as they arrive
+# and handled right away. Ticks and rendering are separate tasks, each of which
+# sleeps until its own deadline on the scheduler. Between them the process is
+# idle. Windows cannot watch the console from the event loop, so there the
+# keyboard is polled every few milliseconds instead.
+#
+# While a collision is on screen, keys that restart or load the game wait until
+# the collision has been finished, as they do in the polling loop.
+class AsyncTextRunner:
+    WINDOWS_POLL_INTERVAL = 0.005
+    DEFERRED_KEYS = ("r", "p")
+
+    def __init__(self, ophidian):
+        self.ophidian = ophidian
+        self.keys = None
+        self.stopped = None
+        self.playing = None
+
+    def run(self):
+        asyncio.run(self.main())
+
+    async def main(self):
+        ophidian = self.ophidian
+        renderer = ophidian.textRenderer
+        self.keys = asyncio.Queue()
+        self.stopped = asyncio.Event()
+        self.playing = asyncio.Event()
+        self.playing.set()
+        loop = asyncio.get_running_loop()
+
+        renderer.enableRawMode()
+        ophidian.scheduler.reset()
+        if os.name != "nt":
+            loop.add_reader(sys.stdin.fileno(), self.readKeys)
+            readers = []
+        else:
+            readers = [asyncio.create_task(self.pollKeys())]
+        tasks = readers + [
+            asyncio.create_task(self.handleKeys()),
+            asyncio.create_task(self.runTicks()),
+            asyncio.create_task(self.renderFrames()),
+        ]
+        stopped = asyncio.create_task(self.stopped.wait())
+        try:
+            # the other tasks never return, so one finishing first means it raised
+            done, _ = await asyncio.wait(
+                tasks + [stopped], return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+        finally:
+            if os.name != "nt":
+                loop.remove_reader(sys.stdin.fileno())
+            for task in tasks + [stopped]:
+                task.cancel()
+            await asyncio.gather(*tasks, stopped, return_exceptions=True)
+            renderer.disableRawMode()
+
+    # Called by the event loop when stdin is readable.
+    # Stops the runner if stdin has ended, since the reader would otherwise fire forever.
+    def readKeys(self):
+        keys = self.ophidian.textRenderer.readKeys()
+        if keys is None:
+            asyncio.get_running_loop().remove_reader(sys.stdin.fileno())
+            self.stopped.set()
+            return
+        for key in keys:
+            self.keys.put_nowait(key)
+
+    async def pollKeys(self):
+        while True:
+            self.readKeys()
+            await asyncio.sleep(self.WINDOWS_POLL_INTERVAL)
+
+    # Stops the runner once the game is no longer running.
+    def checkRunning(self):
+        if not self.ophidian.running:
+            self.stopped.set()
+
+    async def handleKeys(self):
+        while True:
+            key = await self.keys.get()
+            if key in self.DEFERRED_KEYS:
+                await self.playing.wait()
+            self.ophidian.handleKeyDownEvent(key)
+            self.checkRunning()
+
+    async def runTicks(self):
+        ophidian = self.ophidian
+        scheduler = ophidian.scheduler
+        profiler = ophidian.profiler
+        while True:
+            await asyncio.sleep(scheduler.getTimeUntilNextTick())
+            dueTicks = scheduler.getDueTicks()
+            if dueTicks == 0:
+                continue
+            timer = profiler.startTimer()
+            collided = False
+            for _ in range(dueTicks):
+                if ophidian.stepEngine(handleCollision=False) is None:
+                    collided = True
+                    break
+            profiler.stopTimer("ticks", timer)
+
+            if collided:
+                # keep handling input and let the loop idle while the collision is shown
+                self.playing.clear()
+                ophidian.showCollision()
+                await asyncio.sleep(ophidian.getCollisionPause())
+                if ophidian.engine.hasCollided():
+                    ophidian.finishCollision()
+                self.playing.set()
+                self.checkRunning()
+
+    async def renderFrames(self):
+        ophidian = self.ophidian
+        scheduler = ophidian.scheduler
+        profiler = ophidian.profiler
+        while True:
+            await asyncio.sleep(scheduler.getTimeUntilNextFrame())
+            if scheduler.isFrameDue():
+                timer = profiler.startTimer()
+                ophidian.renderTextUI()
+                profiler.stopTimer("renderTextUI", timer)
@@ -1,8 +1,11 @@
 import os
+import re
 import sys
 import termios
 import tty
 import select
+import time
+from lib.pyenvlib.cellState import CellState
 
 # Windows-specific import
 try:
@@ -14,133 +17,285 @@ except ImportError:
 # @author Daniel McCoy Stephenson
 # @since October 15th, 2025
 class TextRenderer:
-    def __init__(self, config):
+    CONTROLS = "Controls: w/↑=Up, a/←=Left, s/↓=Down, d/→=Right, r=Restart, o=Save, p=Load, q=Quit"
+    LEGEND = "Legend: H=Head, S=Snake, F=Food, .=Empty"
+    COLLISION = "[!] COLLISION! The ophidian collides with itself!"
+    NONZERO_BYTE = re.compile(b"[^\x00]")
+
+    def __init__(self, config, output=None):
         self.config = config
+        self.output = output if output is not None else sys.stdout
         self.old_settings = None
+        self.rawMode = False
+        self.cellSymbols = {
+            CellState.EMPTY: ".",
+            CellState.OCCUPIED: "?",
+            CellState.SNAKE: "S",
+            CellState.FOOD: "F",
+            CellState.WALL: "#",
+        }
+        self.buffer = []
+        self.message = ""
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the previous frame so that the next one is drawn in full"""
+        self.previousCells = None
+        self.previousHead = -1
+        self.previousSize = None
+        self.previousCollision = None
+        self.previousStats = None
+        self.controlsDrawn = False
+        self.previousMessage = None
 
     def clearScreen(self):
-        os.system('clear' if os.name != 'nt' else 'cls')
+        """Queue an escape sequence that clears the screen and homes the cursor"""
+        self.buffer.append("\x1b[2J\x1b[H")
 
-    def renderGrid(self, environment, snakeParts, collision):
-        """Render the game grid as text"""
-        self.clearScreen()
-        
-        grid = environment.getGrid()
-        rows = grid.getRows()
-        cols = grid.getColumns()
-        
-        # Create a display grid
-        display = []
-        for _ in range(cols):
-            display.append(['.'] * rows)
-        
-        # Mark snake parts
-        for snakePart in snakeParts:
-            locationID = snakePart.getLocationID()
-            if locationID is not None:
-                location = grid.getLocation(locationID)
-                x = location.getX()
-                y = location.getY()
-                display[y][x] = 'S'
-        
-        # Mark head of snake
+    def moveCursor(self, row, column):
+        """Queue an escape sequence that moves the cursor (1-based row and column)"""
+        self.buffer.append(f"\x1b[{row};{column}H")
+
+    def writeLine(self, row, text):
+        """Queue a full line of text at the given row, clearing what was there"""
+        self.moveCursor(row, 1)
+        self.buffer.append(text)
+        self.buffer.append("\x1b[K")
+
+    def getHeadIndex(self, grid, snakeParts):
+        """Return the location index of the snake's head, or -1 if it is not on the grid"""
         if len(snakeParts) > 0:
             headLocationID = snakeParts[0].getLocationID()
             if headLocationID is not None:
                 headLocation = grid.getLocation(headLocationID)
-                hx = headLocation.getX()
-                hy = headLocation.getY()
-                display[hy][hx] = 'H'
-        
-        # Mark food
-        for locationId in grid.getLocations():
-            location = grid.getLocation(locationId)
-            for eid in location.getEntities():
-                entity = location.getEntity(eid)
-                if entity.getName() == "Food":
-                    x = location.getX()
-                    y = location.getY()
-                    display[y][x] = 'F'
-        
-        # Print border
-        print('┌' + '─' * (rows * 2 + 1) + '┐')
-        
-        # Print grid
-        for row in display:
-            print('│ ' + ' '.join(row) + ' │')
-        
-        # Print border
-        print('└' + '─' * (rows * 2 + 1) + '┘')
-        
-        if collision:
-            print("\n[!] COLLISION! The ophidian collides with itself!")
-        
-        print("\nLegend: H=Head, S=Snake, F=Food, .=Empty")
+                return headLocation.getY() * grid.getColumns() + headLocation.getX()
+        return -1
+
+    def buildFrame(self, grid, snakeParts):
+        """Return the symbol of every cell in row-major order"""
+        # Build the frame from the occupancy layer
+        symbols = self.cellSymbols
+        frame = [symbols[state] for state in grid.getCellStates()]
+
+        # Mark head of snake
+        head = self.getHeadIndex(grid, snakeParts)
+        if head != -1:
+            frame[head] = "H"
+        return frame
+
+    def findChangedCells(self, cells, head):
+        """Return the indices of the cells that look different from the previous frame"""
+        previousCells = self.previousCells
+        changed = []
+        if cells != previousCells:
+            # XOR the two boards as integers so that only changed cells are non-zero bytes
+            size = len(cells)
+            difference = (
+                int.from_bytes(cells, "little")
+                ^ int.from_bytes(previousCells, "little")
+            ).to_bytes(size, "little")
+            changed = [
+                match.start() for match in self.NONZERO_BYTE.finditer(difference)
+            ]
+        if head != self.previousHead:
+            for index in (self.previousHead, head):
+                if index != -1 and index not in changed:
+                    changed.append(index)
+        return changed
+
+    def formatGrid(self, environment, snakeParts):
+        """Return the game grid as plain text with a border, without escape sequences"""
+        grid = environment.getGrid()
+        cols = grid.getColumns()
+        frame = self.buildFrame(grid, snakeParts)
+        border = "─" * (cols * 2 + 1)
+        lines = ["┌" + border + "┐"]
+        for y in range(grid.getRows()):
+            lines.append("│ " + " ".join(frame[y * cols : (y + 1) * cols]) + " │")
+        lines.append("└" + border + "┘")
+        return "\n".join(lines)
+
+    def renderGrid(self, environment, snakeParts, collision):
+        """Render the game grid as text, redrawing only the cells that changed since the last frame"""
+        grid = environment.getGrid()
+        rows = grid.getRows()
+        cols = grid.getColumns()
+        cells = grid.getCellStates()
+        head = self.getHeadIndex(grid, snakeParts)
+
+        if self.previousSize != (cols, rows):
+            # The board changed shape, so everything below it moves too
+            self.invalidate()
+            self.previousSize = (cols, rows)
+            self.clearScreen()
+            frame = self.buildFrame(grid, snakeParts)
+            border = "─" * (cols * 2 + 1)
+            self.writeLine(1, "┌" + border + "┐")
+            for y in range(rows):
+                self.writeLine(
+                    y + 2, "│ " + " ".join(frame[y * cols : (y + 1) * cols]) + " │"
+                )
+            self.writeLine(rows + 2, "└" + border + "┘")
+            self.writeLine(rows + 6, self.LEGEND)
+        else:
+            symbols = self.cellSymbols
+            for index in self.findChangedCells(cells, head):
+                y, x = divmod(index, cols)
+                self.moveCursor(y + 2, x * 2 + 3)
+                self.buffer.append("H" if index == head else symbols[cells[index]])
+        self.previousCells = bytes(cells)
+        self.previousHead = head
+
+        if collision != self.previousCollision:
+            self.writeLine(rows + 4, self.COLLISION if collision else "")
+            self.previousCollision = collision
+
+        if self.message != self.previousMessage:
+            self.writeLine(rows + 5, self.message)
+            self.previousMessage = self.message
+
+    def showMessage(self, text):
+        """
+        Show a message to the player
+        While raw mode is on it goes on the status line under the board with the next frame,
+        so that it cannot land on cells that are not redrawn. Otherwise it is printed as a line.
+        """
+        if self.rawMode:
+            self.message = text
+        else:
+            self.output.write(text + "\n")
+            self.output.flush()
 
     def renderStats(self, level, snakeLength, score, percentage):
-        """Render game statistics"""
-        print(f"\nLevel: {level}")
-        print(f"Length: {snakeLength}")
-        print(f"Score: {score}")
-        print(f"Progress: {int(percentage * 100)}%")
-        
+        """Render game statistics if they changed since the last frame"""
+        stats = (level, snakeLength, score, percentage)
+        if stats == self.previousStats:
+            return
+        self.previousStats = stats
+
         # Draw progress bar
         bar_length = 30
         filled = int(bar_length * percentage)
-        bar = '█' * filled + '░' * (bar_length - filled)
-        print(f"[{bar}]")
+        bar = "█" * filled + "░" * (bar_length - filled)
+
+        top = self.previousSize[1] + 8
+        self.writeLine(top, f"Level: {level}")
+        self.writeLine(top + 1, f"Length: {snakeLength}")
+        self.writeLine(top + 2, f"Score: {score}")
+        self.writeLine(top + 3, f"Progress: {int(percentage * 100)}%")
+        self.writeLine(top + 4, f"[{bar}]")
 
     def renderControls(self):
-        """Render control instructions"""
-        print("\nControls: w/↑=Up, a/←=Left, s/↓=Down, d/→=Right, r=Restart, q=Quit")
+        """Render control instructions once per full redraw"""
+        if self.controlsDrawn:
+            return
+        self.controlsDrawn = True
+        self.writeLine(self.previousSize[1] + 14, self.CONTROLS)
+
+    def flush(self):
+        """Write everything queued for this frame in a single call"""
+        if not self.buffer:
+            return
+        self.output.write("".join(self.buffer))
+        self.output.flush()
+        self.buffer = []
 
     def enableRawMode(self):
-        """Enable raw mode for non-blocking keyboard input"""
-        if os.name != 'nt':
+        """Enable raw mode for non-blocking keyboard input and hide the cursor"""
+        if os.name != "nt":
             self.old_settings = termios.tcgetattr(sys.stdin)
             tty.setcbreak(sys.stdin.fileno())
+        else:
+            # Turns on escape sequence processing in the Windows console
+            os.system("")
+        self.rawMode = True
+        self.buffer.append("\x1b[?25l")
+        self.invalidate()
+        self.flush()
 
     def disableRawMode(self):
-        """Disable raw mode and restore terminal settings"""
-        if os.name != 'nt' and self.old_settings:
+        """Disable raw mode if it is on, restore terminal settings and put the cursor below the game"""
+        if not self.rawMode:
+            return
+        self.rawMode = False
+        if self.previousSize is not None:
+            self.moveCursor(self.previousSize[1] + 16, 1)
+        self.buffer.append("\x1b[?25h")
+        self.flush()
+        if os.name != "nt" and self.old_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
 
+    def readKeys(self):
+        """
+        Return every key press that is waiting, without blocking, or None once stdin has ended
+        Meant to be called when stdin is readable, such as from an event loop reader
+        """
+        if os.name == "nt":
+            keys = []
+            key = self.getKeyPress()
+            while key:
+                keys.append(key)
+                key = self.getKeyPress()
+            return keys
+
+        data = os.read(sys.stdin.fileno(), 1024)
+        if not data:
+            # a readable stdin with nothing to read has been closed
+            return None
+        text = data.decode("utf-8", errors="ignore")
+        keys = []
+        index = 0
+        while index < len(text):
+            # Arrow keys arrive as three-character escape sequences
+            if text.startswith("\x1b[", index) and index + 2 < len(text):
+                keys.append(text[index : index + 3])
+                index += 3
+            else:
+                keys.append(text[index])
+                index += 1
+        return keys
+
     def getKeyPress(self, timeout=0):
         """
-        Get a key press without blocking (non-blocking input)
+        Get a key press, waiting up to timeout seconds for one (0 does not block)
         Returns the key pressed or None if no key was pressed
         Handles arrow keys by reading full escape sequences
         """
-        if os.name != 'nt':
+        if os.name != "nt":
             # Unix/Linux/Mac
             if select.select([sys.stdin], [], [], timeout)[0]:
                 ch = sys.stdin.read(1)
                 # Check if this is the start of an escape sequence
-                if ch == '\x1b':
+                if ch == "\x1b":
                     # Try to read the rest of the arrow key sequence
                     if select.select([sys.stdin], [], [], 0.01)[0]:
                         ch2 = sys.stdin.read(1)
-                        if ch2 == '[':
+                        if ch2 == "[":
                             if select.select([sys.stdin], [], [], 0.01)[0]:
                                 ch3 = sys.stdin.read(1)
                                 # Return full escape sequence
-                                return '\x1b[' + ch3
+                                return "\x1b[" + ch3
                     return ch
                 return ch
         else:
             # Windows
+            if msvcrt:
+                # msvcrt cannot wait on the console, so poll in short sleeps until the timeout
+                deadline = time.perf_counter() + timeout
+                while not msvcrt.kbhit() and time.perf_counter() < deadline:
+                    time.sleep(min(0.005, max(0, deadline - time.perf_counter())))
             if msvcrt and msvcrt.kbhit():
                 ch = msvcrt.getch()
                 # Handle arrow keys on Windows
-                if ch in (b'\xe0', b'\x00'):
+                if ch in (b"\xe0", b"\x00"):
                     ch2 = msvcrt.getch()
                     # Map Windows arrow keys to escape sequences
                     arrow_map = {
-                        b'H': '\x1b[A',  # Up
-                        b'P': '\x1b[B',  # Down
-                        b'M': '\x1b[C',  # Right
-                        b'K': '\x1b[D',  # Left
+                        b"H": "\x1b[A",  # Up
+                        b"P": "\x1b[B",  # Down
+                        b"M": "\x1b[C",  # Right
+                        b"K": "\x1b[D",  # Left
                     }
-                    return arrow_map.get(ch2, ch2.decode('utf-8', errors='ignore'))
-                return ch.decode('utf-8', errors='ignore')
+                    return arrow_map.get(ch2, ch2.decode("utf-8", errors="ignore"))
+                return ch.decode("utf-8", errors="ignore")
         return None
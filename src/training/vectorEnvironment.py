@@ -0,0 +1,154 @@
+import copy
+from config.config import Config
+from engine.gameEngine import GameEngine
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+
+# Optional dependency, only needed for training
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# @author agent
+# @since October 17th, 2026
+#
+# Runs several headless games in lockstep behind a reset()/step(actions)
+# interface for training agents. Observations are written into buffers that
+# are allocated once. Each call returns the same arrays, so copy them to keep
+# a step's values.
+#
+# - cells: N x size x size cell states. Locations beyond a smaller level's grid are WALL.
+# - heads: N x 2 head coordinates (x, y)
+# - foods: N x 2 food coordinates (x, y), or -1 when there is no food
+# - lengths: N ophidian lengths
+# - levels: N current levels
+#
+# Grids grow by two each level up to maxGridSize, which is also the size of the
+# cells buffer. It comes from the maxGridSize argument or the config, which
+# must agree if both set it, and is otherwise DEFAULT_MAX_GRID_SIZE. A config
+# whose gridSize is larger keeps that size instead.
+# An action is a Direction value, or -1 to keep going straight. A game is done
+# when its ophidian collides. It then starts again at once following the level
+# rule of checkForLevelProgressAndReinitialize, so the observation returned
+# with done set already shows the next game.
+class VectorEnvironment:
+    FOOD_REWARD = 1.0
+    COLLISION_REWARD = -1.0
+    DEFAULT_MAX_GRID_SIZE = 12
+
+    def __init__(self, numEnvironments, config=None, seed=None, maxGridSize=None):
+        if numpy is None:
+            raise ImportError("VectorEnvironment requires NumPy")
+        # the games get their own copy of the config, capped to fit the buffers
+        config = copy.copy(config if config is not None else Config())
+        if maxGridSize is None:
+            maxGridSize = config.maxGridSize
+        elif config.maxGridSize is not None and config.maxGridSize != maxGridSize:
+            raise ValueError(
+                "maxGridSize %d does not match the config's maxGridSize %d"
+                % (maxGridSize, config.maxGridSize)
+            )
+        if maxGridSize is None:
+            maxGridSize = self.DEFAULT_MAX_GRID_SIZE
+        size = max(config.gridSize, maxGridSize)
+        config.maxGridSize = size
+        self.config = config
+        self.numEnvironments = numEnvironments
+        self.engines = [
+            GameEngine(config, None if seed is None else seed + i)
+            for i in range(numEnvironments)
+        ]
+        self.directions = tuple(Direction)
+
+        self.size = size
+        self.cells = numpy.full(
+            (numEnvironments, size, size), CellState.WALL, dtype=numpy.uint8
+        )
+        self.heads = numpy.zeros((numEnvironments, 2), dtype=numpy.int32)
+        self.foods = numpy.full((numEnvironments, 2), -1, dtype=numpy.int32)
+        self.lengths = numpy.zeros(numEnvironments, dtype=numpy.int32)
+        self.levels = numpy.zeros(numEnvironments, dtype=numpy.int32)
+        self.rewards = numpy.zeros(numEnvironments, dtype=numpy.float32)
+        self.dones = numpy.zeros(numEnvironments, dtype=bool)
+        self.observations = {
+            "cells": self.cells,
+            "heads": self.heads,
+            "foods": self.foods,
+            "lengths": self.lengths,
+            "levels": self.levels,
+        }
+
+        # NumPy views of each grid's cell states, rebuilt when a grid replaces its buffer
+        self.cellSources = [None] * numEnvironments
+        self.cellViews = [None] * numEnvironments
+
+    def getNumEnvironments(self):
+        return self.numEnvironments
+
+    def getEngines(self):
+        return self.engines
+
+    # Returns the width and height of the cells observation.
+    def getSize(self):
+        return self.size
+
+    # Starts every game again from the first level and returns the observations.
+    # If a seed is given, game i is seeded with seed + i.
+    def reset(self, seed=None):
+        for i, engine in enumerate(self.engines):
+            if seed is not None:
+                engine.setSeed(seed + i)
+            engine.setLevel(1)
+            engine.initialize()
+            self.writeObservation(i)
+        self.rewards[:] = 0
+        self.dones[:] = False
+        return self.observations
+
+    # Advances every game by one tick and returns (observations, rewards, dones).
+    def step(self, actions):
+        directions = self.directions
+        rewards = self.rewards
+        dones = self.dones
+        for i, engine in enumerate(self.engines):
+            action = actions[i]
+            result = engine.step(None if action < 0 else directions[action])
+            if result.hasCollided():
+                rewards[i] = self.COLLISION_REWARD
+                dones[i] = True
+                engine.checkForLevelProgressAndReinitialize()
+            else:
+                rewards[i] = self.FOOD_REWARD if result.hasEatenFood() else 0.0
+                dones[i] = False
+            self.writeObservation(i)
+        return self.observations, rewards, dones
+
+    # Copies the state of one game into the observation buffers.
+    def writeObservation(self, i):
+        engine = self.engines[i]
+        grid = engine.getEnvironment().getGrid()
+        columns = grid.getColumns()
+        rows = grid.getRows()
+        cellStates = grid.getCellStates()
+
+        if cellStates is not self.cellSources[i]:
+            # the grid was resized, so every location outside it becomes a wall
+            self.cellSources[i] = cellStates
+            self.cellViews[i] = numpy.frombuffer(cellStates, dtype=numpy.uint8).reshape(
+                rows, columns
+            )
+            self.cells[i] = CellState.WALL
+        self.cells[i, :rows, :columns] = self.cellViews[i]
+
+        head = grid.getLocation(engine.getSelectedSnakePart().getLocationID())
+        self.heads[i, 0] = head.getX()
+        self.heads[i, 1] = head.getY()
+        food = cellStates.find(CellState.FOOD)
+        if food == -1:
+            self.foods[i] = -1
+        else:
+            self.foods[i, 1], self.foods[i, 0] = divmod(food, columns)
+        self.lengths[i] = len(engine.getSnakeBody())
+        self.levels[i] = engine.getLevel()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the game's modules import each other from src, as when it is run with python src/ophidian.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
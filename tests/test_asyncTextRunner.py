@@ -0,0 +1,56 @@
+import asyncio
+import io
+import os
+import sys
+
+import pytest
+
+from config.config import Config
+from textui.asyncTextRunner import AsyncTextRunner
+from textui.textrenderer import TextRenderer
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="stdin is polled on Windows")
+
+
+# Stands in for Ophidian, which the runner only needs for its text renderer here.
+class FakeOphidian:
+    def __init__(self):
+        self.textRenderer = TextRenderer(Config(), io.StringIO())
+
+
+def runReader(monkeypatch, data):
+    readEnd, writeEnd = os.pipe()
+    os.write(writeEnd, data)
+    os.close(writeEnd)
+    stdin = os.fdopen(readEnd)
+    monkeypatch.setattr(sys, "stdin", stdin)
+    runner = AsyncTextRunner(FakeOphidian())
+
+    async def main():
+        runner.keys = asyncio.Queue()
+        runner.stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.add_reader(readEnd, runner.readKeys)
+        try:
+            await asyncio.wait_for(runner.stopped.wait(), 1)
+            # the reader must have removed itself
+            assert not loop.remove_reader(readEnd)
+        finally:
+            loop.remove_reader(readEnd)
+
+    try:
+        asyncio.run(main())
+    finally:
+        stdin.close()
+    keys = []
+    while not runner.keys.empty():
+        keys.append(runner.keys.get_nowait())
+    return keys
+
+
+def test_end_of_stdin_stops_the_runner(monkeypatch):
+    assert runReader(monkeypatch, b"") == []
+
+
+def test_keys_before_end_of_stdin_are_kept(monkeypatch):
+    assert runReader(monkeypatch, b"wa\x1b[A") == ["w", "a", "\x1b[A"]
@@ -0,0 +1,14 @@
+import sys
+
+import pytest
+
+import batchRun
+
+
+@pytest.mark.parametrize("arguments", [["--games", "0"], ["--level-growth", "-1"]])
+def test_invalid_arguments_are_rejected(arguments, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["batchRun.py"] + arguments)
+    with pytest.raises(SystemExit) as exit:
+        batchRun.main()
+    assert exit.value.code == 2
+    assert arguments[0] in capsys.readouterr().err
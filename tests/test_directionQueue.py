@@ -0,0 +1,62 @@
+from controls.directionQueue import DirectionQueue
+from lib.pyenvlib.direction import Direction
+
+
+def test_pop_returns_presses_oldest_first_with_their_times():
+    queue = DirectionQueue()
+    assert queue.push(Direction.UP, Direction.RIGHT, 10)
+    assert queue.push(Direction.LEFT, Direction.RIGHT, 20)
+    assert len(queue) == 2
+    assert queue.pop() == (Direction.UP, 10)
+    assert queue.pop() == (Direction.LEFT, 20)
+    assert queue.pop() == (None, -1)
+
+
+def test_repeat_of_last_queued_direction_is_dropped():
+    queue = DirectionQueue()
+    assert queue.push(Direction.UP, Direction.RIGHT, 10)
+    assert not queue.push(Direction.UP, Direction.RIGHT, 20)
+    assert len(queue) == 1
+
+
+def test_repeat_of_current_direction_is_dropped_when_empty():
+    queue = DirectionQueue()
+    assert not queue.push(Direction.RIGHT, Direction.RIGHT, 10)
+    assert len(queue) == 0
+
+
+def test_reversal_of_last_queued_direction_is_dropped():
+    queue = DirectionQueue()
+    assert queue.push(Direction.UP, Direction.RIGHT, 10)
+    assert not queue.push(Direction.DOWN, Direction.RIGHT, 20)
+    # checked against the queued UP, not the current RIGHT
+    assert queue.push(Direction.LEFT, Direction.RIGHT, 30)
+    assert queue.pop() == (Direction.UP, 10)
+    assert queue.pop() == (Direction.LEFT, 30)
+
+
+def test_reversal_of_current_direction_is_dropped_when_empty():
+    queue = DirectionQueue()
+    assert not queue.push(Direction.LEFT, Direction.RIGHT, 10)
+    assert queue.pop() == (None, -1)
+
+
+def test_presses_beyond_capacity_are_dropped():
+    queue = DirectionQueue(capacity=2)
+    assert queue.push(Direction.UP, Direction.RIGHT, 10)
+    assert queue.push(Direction.LEFT, Direction.RIGHT, 20)
+    assert not queue.push(Direction.DOWN, Direction.RIGHT, 30)
+    assert len(queue) == 2
+    queue.pop()
+    # popping makes room again
+    assert queue.push(Direction.DOWN, Direction.RIGHT, 40)
+    assert queue.pop() == (Direction.LEFT, 20)
+    assert queue.pop() == (Direction.DOWN, 40)
+
+
+def test_clear_empties_the_queue():
+    queue = DirectionQueue()
+    queue.push(Direction.UP, Direction.RIGHT, 10)
+    queue.clear()
+    assert len(queue) == 0
+    assert queue.pop() == (None, -1)
@@ -0,0 +1,110 @@
+import pytest
+
+from scheduling.fixedTimestepScheduler import FixedTimestepScheduler
+
+
+# A clock that only moves when told to. Sleeping moves it forward by the time slept.
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def createScheduler(clock, ticksPerSecond=4, framesPerSecond=8, maxCatchUpTicks=5):
+    return FixedTimestepScheduler(
+        ticksPerSecond, framesPerSecond, maxCatchUpTicks, clock=clock, sleep=clock.sleep
+    )
+
+
+def test_ticks_are_due_once_per_interval():
+    clock = FakeClock()
+    scheduler = createScheduler(clock)
+    assert scheduler.getDueTicks() == 0
+    clock.advance(0.25)
+    assert scheduler.getDueTicks() == 1
+    assert scheduler.getDueTicks() == 0
+
+
+def test_ticks_catch_up_after_falling_behind():
+    clock = FakeClock()
+    scheduler = createScheduler(clock)
+    clock.advance(0.75)
+    assert scheduler.getDueTicks() == 3
+    # the deadline stays on the original timeline
+    clock.advance(0.25)
+    assert scheduler.getDueTicks() == 1
+
+
+def test_catch_up_is_limited_and_the_backlog_dropped():
+    clock = FakeClock()
+    scheduler = createScheduler(clock, maxCatchUpTicks=2)
+    clock.advance(2.5)
+    assert scheduler.getDueTicks() == 2
+    assert scheduler.getDueTicks() == 0
+    clock.advance(0.25)
+    assert scheduler.getDueTicks() == 1
+
+
+def test_one_tick_per_pass_without_tick_limit():
+    clock = FakeClock()
+    scheduler = createScheduler(clock)
+    scheduler.setLimitTicks(False)
+    assert scheduler.getDueTicks() == 1
+    assert scheduler.getDueTicks() == 1
+    clock.advance(10)
+    assert scheduler.getDueTicks() == 1
+    assert scheduler.getTimeUntilNextDeadline() == 0
+
+
+def test_frames_are_capped_at_the_frame_rate():
+    clock = FakeClock()
+    scheduler = createScheduler(clock)
+    frames = 0
+    for _ in range(999):
+        clock.advance(0.001)
+        if scheduler.isFrameDue():
+            frames += 1
+    # just under a second at 8 frames per second, starting with a frame that is due at once
+    assert frames == 8
+
+
+def test_missed_frames_are_not_rendered_back_to_back():
+    clock = FakeClock()
+    scheduler = createScheduler(clock)
+    assert scheduler.isFrameDue()
+    clock.advance(1)
+    assert scheduler.isFrameDue()
+    assert not scheduler.isFrameDue()
+    assert scheduler.getTimeUntilNextFrame() == pytest.approx(0.125)
+
+
+def test_wait_sleeps_until_the_next_deadline():
+    clock = FakeClock()
+    scheduler = createScheduler(clock)
+    assert scheduler.isFrameDue()
+    clock.advance(0.05)
+    scheduler.wait()
+    # the next frame, at 0.125 seconds, comes before the next tick
+    assert clock.sleeps == [pytest.approx(0.075)]
+    assert scheduler.isFrameDue()
+    scheduler.wait()
+    assert clock.sleeps[-1] == pytest.approx(0.125)
+    assert scheduler.getDueTicks() == 1
+
+
+def test_wait_does_not_sleep_when_a_deadline_has_passed():
+    clock = FakeClock()
+    scheduler = createScheduler(clock)
+    clock.advance(1)
+    scheduler.wait()
+    assert clock.sleeps == []
@@ -0,0 +1,41 @@
+from config.config import Config
+from engine.gameEngine import GameEngine
+
+
+def createEngine(**settings):
+    config = Config()
+    for name, value in settings.items():
+        setattr(config, name, value)
+    return GameEngine(config, seed=0)
+
+
+def test_grid_grows_by_two_each_level_by_default():
+    engine = createEngine(gridSize=5)
+    sizes = []
+    for level in range(1, 5):
+        engine.setLevel(level)
+        sizes.append(engine.getGridSize())
+    assert sizes == [5, 7, 9, 11]
+
+
+def test_level_growth_sets_how_much_the_grid_grows():
+    engine = createEngine(gridSize=5, levelGrowth=4)
+    engine.setLevel(3)
+    assert engine.getGridSize() == 13
+    engine = createEngine(gridSize=5, levelGrowth=0)
+    engine.setLevel(3)
+    assert engine.getGridSize() == 5
+
+
+def test_grid_growth_stops_at_max_grid_size():
+    engine = createEngine(gridSize=5, maxGridSize=8)
+    engine.setLevel(10)
+    assert engine.getGridSize() == 8
+
+
+def test_new_level_uses_the_grown_size():
+    engine = createEngine(gridSize=5, levelGrowth=3)
+    engine.setLevel(2)
+    engine.initialize()
+    grid = engine.getEnvironment().getGrid()
+    assert (grid.getColumns(), grid.getRows()) == (8, 8)
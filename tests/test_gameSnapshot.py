@@ -0,0 +1,169 @@
+import struct
+
+import pytest
+
+from config.config import Config
+from engine.gameEngine import GameEngine
+from engine.gameSnapshot import GameSnapshot
+from lib.pyenvlib.cellState import CellState
+from lib.pyenvlib.direction import Direction
+
+
+def createEngine():
+    engine = GameEngine(Config(), seed=3)
+    for tick in range(40):
+        engine.step(Direction.DOWN if tick % 7 == 0 else None)
+        if engine.hasCollided():
+            engine.checkForLevelProgressAndReinitialize()
+    return engine
+
+
+# Returns everything about an engine's game that a snapshot should keep.
+def describe(engine):
+    grid = engine.getEnvironment().getGrid()
+    parts = [(part.getLocationID(), part.getColor()) for part in engine.getSnakeBody()]
+    return (
+        grid.getColumns(),
+        grid.getRows(),
+        bytes(grid.getCellStates()),
+        len(parts),
+        engine.getLevel(),
+        engine.getScore(),
+        engine.getTick(),
+        engine.hasCollided(),
+        engine.getSelectedSnakePart().getDirection(),
+        engine.getRandom().getstate(),
+    )
+
+
+# Returns the offset of the body in a saved snapshot.
+def getBodyOffset(snapshot):
+    return 4 + GameSnapshot.HEADER.size + len(snapshot.getCellStates())
+
+
+def test_round_trip_keeps_every_field():
+    snapshot = createEngine().snapshot()
+    copy = GameSnapshot.fromBytes(snapshot.toBytes())
+    assert copy.getColumns() == snapshot.getColumns()
+    assert copy.getRows() == snapshot.getRows()
+    assert copy.getLevel() == snapshot.getLevel()
+    assert copy.getScore() == snapshot.getScore()
+    assert copy.getTick() == snapshot.getTick()
+    assert copy.getHeadDirection() == snapshot.getHeadDirection()
+    assert copy.hasCollided() == snapshot.hasCollided()
+    assert copy.getCellStates() == snapshot.getCellStates()
+    assert list(copy.getBody()) == list(snapshot.getBody())
+    assert copy.getColors() == snapshot.getColors()
+    assert copy.getFoodColors() == snapshot.getFoodColors()
+    assert copy.getRandomState() == snapshot.getRandomState()
+
+
+def test_restored_game_plays_on_the_same():
+    engine = createEngine()
+    snapshot = GameSnapshot.fromBytes(engine.snapshot().toBytes())
+    other = GameEngine(Config(), seed=99)
+    other.restore(snapshot)
+    assert describe(other) == describe(engine)
+    for _ in range(30):
+        engine.step(None)
+        other.step(None)
+    assert describe(other) == describe(engine)
+
+
+def test_arrays_are_written_little_endian():
+    snapshot = createEngine().snapshot()
+    data = snapshot.toBytes()
+    body = snapshot.getBody()
+    offset = getBodyOffset(snapshot)
+    assert data[offset : offset + len(body) * 4] == struct.pack(
+        "<%di" % len(body), *body
+    )
+    words = snapshot.getRandomState()[1]
+    assert data[-len(words) * 4 :] == struct.pack("<%dI" % len(words), *words)
+
+
+def test_every_truncated_save_is_rejected():
+    data = createEngine().snapshot().toBytes()
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            GameSnapshot.fromBytes(data[:length])
+
+
+def test_trailing_data_is_rejected():
+    data = createEngine().snapshot().toBytes()
+    with pytest.raises(ValueError):
+        GameSnapshot.fromBytes(data + b"\0")
+
+
+def test_wrong_food_count_is_rejected():
+    snapshot = createEngine().snapshot()
+    data = bytearray(snapshot.toBytes())
+    # turn an empty cell into food without adding a food colour
+    offset = 4 + GameSnapshot.HEADER.size
+    data[offset + snapshot.getCellStates().index(CellState.EMPTY)] = CellState.FOOD
+    with pytest.raises(ValueError, match="food"):
+        GameSnapshot.fromBytes(bytes(data))
+
+
+def test_body_index_outside_the_board_is_rejected():
+    snapshot = createEngine().snapshot()
+    data = bytearray(snapshot.toBytes())
+    offset = getBodyOffset(snapshot)
+    data[offset : offset + 4] = struct.pack("<i", len(snapshot.getCellStates()))
+    with pytest.raises(ValueError, match="outside the board"):
+        GameSnapshot.fromBytes(bytes(data))
+
+
+def test_bad_random_state_is_rejected():
+    data = bytearray(createEngine().snapshot().toBytes())
+    data[-4:] = struct.pack("<I", 9999)
+    with pytest.raises(ValueError, match="random state"):
+        GameSnapshot.fromBytes(bytes(data))
+
+
+def test_unknown_random_version_is_rejected():
+    snapshot = createEngine().snapshot()
+    data = bytearray(snapshot.toBytes())
+    offset = len(data) - len(snapshot.getRandomState()[1]) * 4
+    data[offset - GameSnapshot.RANDOM_HEADER.size] = 2
+    with pytest.raises(ValueError, match="random state"):
+        GameSnapshot.fromBytes(bytes(data))
+
+
+# Returns a copy of a snapshot with some of its constructor arguments replaced.
+def replaceFields(snapshot, **fields):
+    values = {
+        "columns": snapshot.getColumns(),
+        "rows": snapshot.getRows(),
+        "level": snapshot.getLevel() + 1,
+        "score": snapshot.getScore() + 1,
+        "tick": snapshot.getTick() + 1,
+        "headDirection": snapshot.getHeadDirection(),
+        "collision": not snapshot.hasCollided(),
+        "cellStates": snapshot.getCellStates(),
+        "body": snapshot.getBody(),
+        "colors": snapshot.getColors(),
+        "foodColors": snapshot.getFoodColors(),
+        "randomState": snapshot.getRandomState(),
+    }
+    values.update(fields)
+    return GameSnapshot(**values)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"randomState": (3, (0,) * 624 + (9999,), None)},
+        {"randomState": (3, (0,) * 10, None)},
+        {"headDirection": 7},
+    ],
+)
+def test_rejected_restore_leaves_the_engine_unchanged(fields):
+    engine = createEngine()
+    snapshot = replaceFields(engine.snapshot(), **fields)
+    for _ in range(5):
+        engine.step(None)
+    before = describe(engine)
+    with pytest.raises(ValueError):
+        engine.restore(snapshot)
+    assert describe(engine) == before
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from engine.stepResult import StepResult
+
+
+@pytest.fixture
+def ophidian(monkeypatch, tmp_path):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pytest.importorskip("pygame")
+    from ophidian import Ophidian
+
+    ophidian = Ophidian(useTextUI=True, profileOutput=str(tmp_path / "profile.json"))
+    ophidian.textRenderer.output = io.StringIO()
+    return ophidian
+
+
+def test_collision_pause_is_not_timed_as_a_tick(ophidian, monkeypatch):
+    def collide(direction):
+        result = StepResult()
+        result.collided = True
+        ophidian.engine.collision = True
+        return result
+
+    pauses = []
+    monkeypatch.setattr(ophidian.engine, "step", collide)
+    monkeypatch.setattr(ophidian, "getCollisionPause", lambda: 0.2)
+    monkeypatch.setattr(ophidian, "finishCollision", lambda: pauses.append(True))
+
+    ophidian.runTicks(3)
+
+    assert pauses == [True]
+    ticks = ophidian.profiler.samples["ticks"]
+    assert len(ticks) == 1
+    assert ticks[0] < 0.2 * 1e9
@@ -0,0 +1,129 @@
+import io
+import random
+import re
+
+import pytest
+
+from config.config import Config
+from engine.gameEngine import GameEngine
+from lib.pyenvlib.direction import Direction
+from textui.textrenderer import TextRenderer
+
+ESCAPE = re.compile(
+    r"\x1b\[(\d+);(\d+)H|\x1b\[2J|\x1b\[H|\x1b\[K|\x1b\[\?25[lh]|(.)", re.S
+)
+
+
+# Applies the renderer's output to a screen of {(row, column): character}, like a terminal would.
+def applyToScreen(screen, text):
+    row, column = 1, 1
+    for match in ESCAPE.finditer(text):
+        if match.group(1):
+            row, column = int(match.group(1)), int(match.group(2))
+        elif match.group(0) == "\x1b[2J":
+            screen.clear()
+        elif match.group(0) == "\x1b[H":
+            row, column = 1, 1
+        elif match.group(0) == "\x1b[K":
+            for key in [key for key in screen if key[0] == row and key[1] >= column]:
+                del screen[key]
+        elif match.group(3) is not None:
+            if match.group(3) == "\n":
+                row, column = row + 1, 1
+            else:
+                screen[(row, column)] = match.group(3)
+                column += 1
+
+
+def readRow(screen, row, width):
+    return "".join(screen.get((row, column), " ") for column in range(1, width + 1))
+
+
+def createRenderer():
+    renderer = TextRenderer(Config(), io.StringIO())
+    # as after enableRawMode, without needing a terminal
+    renderer.rawMode = True
+    return renderer
+
+
+def renderToScreen(renderer, engine, screen):
+    renderer.renderGrid(
+        engine.getEnvironment(), engine.getSnakeBody(), engine.hasCollided()
+    )
+    renderer.flush()
+    applyToScreen(screen, renderer.output.getvalue())
+    renderer.output.seek(0)
+    renderer.output.truncate()
+
+
+def assertBoardMatches(renderer, engine, screen):
+    expected = renderer.formatGrid(engine.getEnvironment(), engine.getSnakeBody())
+    for row, line in enumerate(expected.split("\n"), start=1):
+        assert readRow(screen, row, len(line) + 10) == line.ljust(len(line) + 10)
+
+
+def test_changed_cells_match_full_board():
+    config = Config()
+    config.gridSize = 9
+    engine = GameEngine(config, seed=4)
+    renderer = createRenderer()
+    screen = {}
+    inputs = random.Random(1)
+    for _ in range(500):
+        direction = None
+        if inputs.random() < 0.3:
+            direction = Direction(inputs.randrange(4))
+        engine.step(direction)
+        if engine.hasCollided():
+            engine.checkForLevelProgressAndReinitialize()
+        renderToScreen(renderer, engine, screen)
+        assertBoardMatches(renderer, engine, screen)
+
+
+def test_messages_do_not_land_on_the_board():
+    engine = GameEngine(Config(), seed=2)
+    renderer = createRenderer()
+    screen = {}
+    renderToScreen(renderer, engine, screen)
+
+    # restarting at the same size does not redraw the whole board
+    engine.checkForLevelProgressAndReinitialize()
+    renderer.showMessage("The ophidian enters the world.")
+    renderToScreen(renderer, engine, screen)
+    assertBoardMatches(renderer, engine, screen)
+
+    rows = engine.getEnvironment().getGrid().getRows()
+    assert readRow(screen, rows + 5, 40).rstrip() == "The ophidian enters the world."
+
+    renderer.showMessage("Game saved to ophidian.sav")
+    renderToScreen(renderer, engine, screen)
+    assertBoardMatches(renderer, engine, screen)
+    assert readRow(screen, rows + 5, 40).rstrip() == "Game saved to ophidian.sav"
+
+
+def test_messages_are_printed_outside_raw_mode():
+    renderer = TextRenderer(Config(), io.StringIO())
+    renderer.showMessage("Game saved to ophidian.sav")
+    assert renderer.output.getvalue() == "Game saved to ophidian.sav\n"
+
+
+def test_game_messages_go_through_the_renderer(capsys, monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pytest.importorskip("pygame")
+    from ophidian import Ophidian
+
+    ophidian = Ophidian(useTextUI=True)
+    renderer = ophidian.textRenderer
+    renderer.output = io.StringIO()
+    renderer.rawMode = True
+    capsys.readouterr()
+    screen = {}
+    ophidian.renderTextUI()
+    applyToScreen(screen, renderer.output.getvalue())
+
+    ophidian.handleKeyDownEvent("r")
+    ophidian.renderTextUI()
+    applyToScreen(screen, renderer.output.getvalue())
+
+    assert capsys.readouterr().out == ""
+    assertBoardMatches(renderer, ophidian.engine, screen)
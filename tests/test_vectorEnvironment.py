@@ -0,0 +1,57 @@
+import pytest
+
+from config.config import Config
+
+numpy = pytest.importorskip("numpy")
+
+from training.vectorEnvironment import VectorEnvironment  # noqa: E402
+
+
+def createConfig(maxGridSize=None):
+    config = Config()
+    config.maxGridSize = maxGridSize
+    return config
+
+
+def test_default_cap_sizes_the_buffers():
+    environment = VectorEnvironment(2, createConfig(), seed=0)
+    assert environment.getSize() == VectorEnvironment.DEFAULT_MAX_GRID_SIZE
+    assert environment.cells.shape == (2, 12, 12)
+
+
+def test_argument_caps_growth_without_changing_the_callers_config():
+    config = createConfig()
+    environment = VectorEnvironment(2, config, seed=0, maxGridSize=7)
+    assert environment.cells.shape == (2, 7, 7)
+    assert config.maxGridSize is None
+    for engine in environment.getEngines():
+        engine.setLevel(10)
+        assert engine.getGridSize() == 7
+
+
+def test_config_cap_is_used_when_no_argument_is_given():
+    environment = VectorEnvironment(2, createConfig(9), seed=0)
+    assert environment.getSize() == 9
+
+
+def test_conflicting_caps_are_rejected():
+    with pytest.raises(ValueError):
+        VectorEnvironment(2, createConfig(9), seed=0, maxGridSize=7)
+    assert VectorEnvironment(2, createConfig(7), seed=0, maxGridSize=7).getSize() == 7
+
+
+def test_observations_follow_the_games():
+    environment = VectorEnvironment(3, createConfig(), seed=0)
+    observations = environment.reset(seed=0)
+    for _ in range(50):
+        observations, rewards, dones = environment.step([-1, 0, 3])
+    for i, engine in enumerate(environment.getEngines()):
+        grid = engine.getEnvironment().getGrid()
+        columns = grid.getColumns()
+        rows = grid.getRows()
+        cells = numpy.frombuffer(bytes(grid.getCellStates()), dtype=numpy.uint8)
+        assert (
+            observations["cells"][i, :rows, :columns] == cells.reshape(rows, columns)
+        ).all()
+        assert observations["lengths"][i] == len(engine.getSnakeBody())
+        assert observations["levels"][i] == engine.getLevel()